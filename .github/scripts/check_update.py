@@ -1,17 +1,37 @@
 from enums import PaperMCAPIProject
 
-from utils import GitHubAPIUtils, PaperMCAPIUtils, VersionUtils
+from utils import (
+    CatalogUtils,
+    DeadlineUtils,
+    GitHubAPIUtils,
+    PaperMCAPIUtils,
+    VersionUtils,
+)
 
 
 def main():
-    all_papermc_api_folia_versions = PaperMCAPIUtils.get_all_versions(
-        PaperMCAPIProject.FOLIA
-    )
+    catalog_result = CatalogUtils.get_all_versions()
+    if catalog_result.is_ok():
+        all_papermc_api_folia_versions = catalog_result.unwrap()
+    else:
+        all_papermc_api_folia_versions = PaperMCAPIUtils.get_all_versions(
+            PaperMCAPIProject.FOLIA
+        )
     all_local_versions = VersionUtils.get_all_local_versions()
-    open_gh_issues = GitHubAPIUtils.get_open_issues().unwrap_or([])
+    open_issues_result = GitHubAPIUtils.get_open_issues()
+    if open_issues_result.is_err():
+        # Without the open issues every unsupported version would get a duplicate issue
+        print(f"Failed to list open issues: {open_issues_result.unwrap_err()}")
+        exit(1)
+    open_gh_issues = open_issues_result.unwrap()
     open_gh_issue_titles = [issue["title"] for issue in open_gh_issues]
 
-    for papermc_api_folia_version in all_papermc_api_folia_versions:
+    for index, papermc_api_folia_version in enumerate(all_papermc_api_folia_versions):
+        if DeadlineUtils.expired():
+            unchecked = all_papermc_api_folia_versions[index:]
+            print(f"Deadline exceeded, versions not checked: {', '.join(unchecked)}")
+            exit(1)
+
         if papermc_api_folia_version not in all_local_versions:
             issue_title = f"New Folia version `{papermc_api_folia_version}`"
             if issue_title not in open_gh_issue_titles:
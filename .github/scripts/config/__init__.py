@@ -1,2 +1,4 @@
+from .catalog import CatalogConfig
+from .deadline import DeadlineConfig
 from .github import GithubConfig
 from .papermc_api import PaperMCAPIConfig
@@ -0,0 +1,9 @@
+import os
+
+
+class CatalogConfig:
+    CACHE_DIR = os.getenv(
+        "PAPERMC_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "folia-docker")
+    )
+    PATH = os.getenv("FOLIA_CATALOG_PATH", os.path.join(CACHE_DIR, "catalog.json"))
+    MAX_AGE = float(os.getenv("FOLIA_CATALOG_MAX_AGE", "300"))
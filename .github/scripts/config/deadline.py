@@ -0,0 +1,5 @@
+import os
+
+
+class DeadlineConfig:
+    BUDGET = float(os.getenv("FOLIA_DEADLINE", "0"))
@@ -13,3 +13,8 @@ class GithubConfig:
 
     REPO_OWNER = REPO_OWNER
     REPO_NAME = REPO_NAME
+
+    TIMEOUT = (
+        float(os.getenv("GITHUB_CONNECT_TIMEOUT", "5")),
+        float(os.getenv("GITHUB_READ_TIMEOUT", "30")),
+    )
@@ -1,2 +1,12 @@
+import os
+
+
 class PaperMCAPIConfig:
-    BASE_URL = "https://api.papermc.io/v2/projects/"
+    BASE_URL = os.getenv("PAPERMC_API_URL", "https://api.papermc.io/v2").rstrip("/") + "/projects/"
+    USER_AGENT = os.getenv(
+        "PAPERMC_USER_AGENT", "folia-docker (+https://github.com/Pablo-Barros/folia-docker)"
+    )
+    TIMEOUT = (
+        float(os.getenv("PAPERMC_CONNECT_TIMEOUT", "5")),
+        float(os.getenv("PAPERMC_READ_TIMEOUT", "30")),
+    )
@@ -1,3 +1,5 @@
+from .catalog import CatalogUtils
+from .deadline import DeadlineExceeded, DeadlineUtils
 from .github import GitHubAPIUtils
 from .papermc_api import PaperMCAPIUtils
 from .version import VersionUtils
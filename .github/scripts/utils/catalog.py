@@ -0,0 +1,22 @@
+import json
+import time
+
+from config import CatalogConfig
+from result import Err, Ok, Result
+
+
+class CatalogUtils:
+    @classmethod
+    def get_all_versions(
+        cls, path: str = CatalogConfig.PATH, max_age: float = CatalogConfig.MAX_AGE
+    ) -> Result[list[str], str]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                catalog = json.load(f)
+        except (OSError, ValueError) as e:
+            return Err(f"Build catalog unavailable: {e}")
+
+        if time.time() - catalog.get("refreshed_at", 0) > max_age:
+            return Err("Build catalog is stale")
+
+        return Ok(list(catalog.get("versions", {})))
@@ -0,0 +1,29 @@
+import time
+
+from config import DeadlineConfig
+
+
+class DeadlineExceeded(TimeoutError):
+    pass
+
+
+class DeadlineUtils:
+    _expires_at = (
+        time.monotonic() + DeadlineConfig.BUDGET if DeadlineConfig.BUDGET > 0 else None
+    )
+
+    @classmethod
+    def expired(cls) -> bool:
+        return cls._expires_at is not None and time.monotonic() >= cls._expires_at
+
+    @classmethod
+    def timeout(cls, timeout: tuple[float, float]) -> tuple[float, float]:
+        if cls._expires_at is None:
+            return timeout
+
+        remaining = cls._expires_at - time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceeded(f"Deadline of {DeadlineConfig.BUDGET:g}s exceeded")
+
+        connect, read = timeout
+        return min(connect, remaining), min(read, remaining)
@@ -5,6 +5,8 @@ from config import GithubConfig
 from result import Err, Ok, Result
 from yarl import URL
 
+from .deadline import DeadlineExceeded, DeadlineUtils
+
 
 class GitHubAPIUtils:
     _base_url = URL("https://api.github.com")
@@ -38,7 +40,15 @@ class GitHubAPIUtils:
             "milestone": milestone,
         }
 
-        response = requests.post(url.__str__(), headers=headers, json=data)
+        try:
+            response = requests.post(
+                url.__str__(),
+                headers=headers,
+                json=data,
+                timeout=DeadlineUtils.timeout(GithubConfig.TIMEOUT),
+            )
+        except (requests.RequestException, DeadlineExceeded) as e:
+            return Err(str(e))
 
         if response.status_code == 201:
             return Ok(None)
@@ -59,7 +69,15 @@ class GitHubAPIUtils:
         }
         params = {"state": "open"}
 
-        response = requests.get(url.__str__(), headers=headers, params=params)
+        try:
+            response = requests.get(
+                url.__str__(),
+                headers=headers,
+                params=params,
+                timeout=DeadlineUtils.timeout(GithubConfig.TIMEOUT),
+            )
+        except (requests.RequestException, DeadlineExceeded) as e:
+            return Err({"message": str(e)})
 
         json = response.json()
 
@@ -3,14 +3,21 @@ from config import PaperMCAPIConfig
 from enums import PaperMCAPIProject
 from yarl import URL
 
+from .deadline import DeadlineUtils
+
 
 class PaperMCAPIUtils:
+    _session = requests.Session()
+    _session.headers["User-Agent"] = PaperMCAPIConfig.USER_AGENT
+
     @classmethod
     def get_all_versions(cls, project: PaperMCAPIProject) -> list[str]:
         base_url = URL(PaperMCAPIConfig.BASE_URL)
 
         url = base_url / project.value
 
-        response = requests.get(url.__str__())
+        response = cls._session.get(
+            url.__str__(), timeout=DeadlineUtils.timeout(PaperMCAPIConfig.TIMEOUT)
+        )
 
         return response.json()["versions"]
@@ -1,20 +1,64 @@
+import argparse
+import json
 import os
+import re
+import signal
 import subprocess
-import sys
-from typing import List
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
 
 from result import Err, Ok, Result, is_err, is_ok
 
-from config import DockerConfig
-from utils import discover_versions, get_latest_stable_or_experimental_build, is_build_experimental
+from config import BuildConfig, DockerConfig
+from deadline import get_deadline
+from fingerprint import find_current_image, get_fingerprint, get_image_fingerprint
+from plan import get_target
+from prefetch import get_prefetched_jar, prefetch
+from tag_policy import get_tag_policy, tag_alias
+from utils import discover_versions
+
+# Lines of a failed build's output repeated in its error message
+ERROR_TAIL_LINES = 20
+
+_print_lock = threading.Lock()
 
 
 def main():
-    if len(sys.argv) > 1:
-        versions = sys.argv[1:]
-        result = build_all(versions)
+    get_deadline()
+    parser = argparse.ArgumentParser(description="Build the Folia Docker images")
+    parser.add_argument("versions", nargs="*", help="Targets to build (default: all discovered versions)")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=BuildConfig.get_build_jobs(),
+        help="Number of images built at the same time (env BUILD_JOBS, default: CPU count)"
+    )
+    parser.add_argument(
+        "--bake", action="store_true", default=BuildConfig.use_bake(),
+        help="Build all images with one docker buildx bake (env BUILD_BAKE)"
+    )
+    parser.add_argument(
+        "--force", action="store_true", default=BuildConfig.force_build(),
+        help="Rebuild images that already carry their input fingerprint (env BUILD_FORCE)"
+    )
+    parser.add_argument(
+        "--cache-dir", default=BuildConfig.get_cache_dir(),
+        help="Import and export the BuildKit cache of each target in this directory (env BUILD_CACHE_DIR)"
+    )
+    parser.add_argument(
+        "--cache-ref", default=BuildConfig.get_cache_ref(),
+        help="Import and export the BuildKit cache of each target as tags of this registry image (env BUILD_CACHE_REF)"
+    )
+    args = parser.parse_args()
+
+    options = {"force": args.force, "cache_dir": args.cache_dir, "cache_ref": args.cache_ref}
+    if args.bake:
+        result = bake_all(args.versions, **options) if args.versions else bake_all(**options)
+    elif args.versions:
+        result = build_all(args.versions, jobs=args.jobs, **options)
     else:
-        result = build_all()
+        result = build_all(jobs=args.jobs, **options)
 
     if is_ok(result):
         print(f"Build process succeeded: {result.unwrap()}")
@@ -23,90 +67,546 @@ def main():
         exit(1)
 
 
-def build(tag: str) -> Result[str, str]:
+def log(tag: str, message: str) -> None:
+    """Print output of a target, prefixed with it so parallel builds stay readable."""
+    with _print_lock:
+        for line in message.splitlines() or [""]:
+            print(f"[{tag}] {line}", flush=True)
+
+
+def get_log_path(tag: str) -> str:
+    """Get the file the full build output of a target is written to."""
+    return os.path.join(BuildConfig.get_build_log_dir(), f"{tag}.log")
+
+
+def get_cache_options(
+    tag: str, cache_dir: Optional[str] = None, cache_ref: Optional[str] = None
+) -> Tuple[List[str], List[str]]:
+    """
+    Get the BuildKit cache import and export options of a target.
+
+    Every target has its own cache scope: a subdirectory of cache_dir
+    and/or a tag of the cache_ref image, so concurrent builds never
+    overwrite each other's cache. Caches are exported in max mode, which
+    includes the intermediate stages (pip install, jar download).
+
+    Args:
+        tag: The tag of the image
+        cache_dir: Local cache directory (default: BUILD_CACHE_DIR)
+        cache_ref: Registry image holding the caches (default: BUILD_CACHE_REF)
+
+    Returns:
+        Tuple of (--cache-from values, --cache-to values)
+    """
+    cache_dir = cache_dir or BuildConfig.get_cache_dir()
+    cache_ref = cache_ref or BuildConfig.get_cache_ref()
+    cache_from, cache_to = [], []
+
+    if cache_dir:
+        path = os.path.join(os.path.abspath(cache_dir), tag)
+        # Importing a scope that was never exported fails the build
+        if os.path.isfile(os.path.join(path, "index.json")):
+            cache_from.append(f"type=local,src={path}")
+        cache_to.append(f"type=local,dest={path},mode=max")
+    if cache_ref:
+        cache_from.append(f"type=registry,ref={cache_ref}:{tag}")
+        cache_to.append(f"type=registry,ref={cache_ref}:{tag},mode=max")
+
+    return cache_from, cache_to
+
+
+def get_build_spec(
+    tag: str,
+    cache_dir: Optional[str] = None,
+    cache_ref: Optional[str] = None,
+    target: Optional[Dict] = None,
+) -> Result[Dict, str]:
+    """
+    Get everything needed to build the image of a target.
+
+    The version, build and channel are pinned from the build plan (see
+    plan.py), so the jar downloaded inside the image is the one the tags
+    were computed for. A jar already fetched by prefetch.py is passed in
+    through the "jars" build context instead of being downloaded.
+
+    Args:
+        tag: The tag of the image
+        cache_dir: Local BuildKit cache directory (see get_cache_options)
+        cache_ref: Registry image holding BuildKit caches (see get_cache_options)
+        target: The pinned target, if already resolved (e.g. by the tag policy)
+
+    Returns:
+        Result[Dict, str]: Ok with the image names ("tags"), build args
+        ("args"), context path ("context"), prefetched jar directory
+        ("jars", None if not prefetched), input fingerprint
+        ("fingerprint", see fingerprint.py) and BuildKit cache options
+        ("cache_from", "cache_to"), or Err with error message
+    """
+    if target is None:
+        target_result = get_target(tag)
+        if is_err(target_result):
+            return target_result
+        target = target_result.unwrap()
+
+    args = {
+        "VERSION": target["version"],
+        "BUILD": str(target["build"]),
+        "CHANNEL": target["channel"],
+    }
+    if target.get("sha256"):
+        args["SHA256"] = target["sha256"]
+    # Lets get-folia.py inside the build use the same API, mirrors or proxy
+    for name in ("PAPERMC_API_URL", "PAPERMC_MIRRORS"):
+        if os.environ.get(name):
+            args[name] = os.environ[name]
+
+    jar_path = get_prefetched_jar(target)
+    if jar_path:
+        args["JAR_SOURCE"] = "prefetched"
+
+    # Stamped as an image label so unchanged targets can be skipped next time
+    fingerprint = get_fingerprint(target)
+    args["FINGERPRINT"] = fingerprint
+
+    cache_from, cache_to = get_cache_options(tag, cache_dir, cache_ref)
+
+    if not os.path.exists(target["context"]):
+        return Err(f"Build context path '{target['context']}' does not exist")
+
+    return Ok({
+        "tags": [DockerConfig.get_image_name(t) for t in target["tags"]],
+        "args": args,
+        "context": target["context"],
+        "jars": os.path.dirname(jar_path) if jar_path else None,
+        "fingerprint": fingerprint,
+        "cache_from": cache_from,
+        "cache_to": cache_to,
+    })
+
+
+def get_skip_reason(spec: Dict) -> Optional[str]:
+    """
+    Get why a target does not need to be built.
+
+    Returns:
+        Optional[str]: Where its image already carries the input fingerprint,
+        or None if it has to be built
+    """
+    location = find_current_image(spec["tags"], spec["fingerprint"])
+    if location is None:
+        return None
+    return f"{location} image is up to date (fingerprint {spec['fingerprint'][:12]})"
+
+
+def build(tag: str, spec: Optional[Dict] = None) -> Result[str, str]:
     """
     Build a Docker image with the specified tag.
 
+    The build output is streamed live with a "[tag]" prefix and written
+    in full to the target's log file (see get_log_path).
+
     Args:
         tag: The tag of the image
+        spec: The target's build spec, if already resolved (see get_build_spec)
 
     Returns:
         Result[str, str]: Ok with success message or Err with error message
     """
     try:
-        version_tag = None  # Initialize for all code paths
-
-        # Handle experimental tagging with stable-first logic
-        if tag == "experimental":
-            # Experimental tag always points to 1.21.11 for now (can be made dynamic later)
-            image_name = DockerConfig.get_image_name("experimental")
-            build_args = ["--build-arg", "VERSION=1.21.11", "--build-arg", "BUILD=2"]
-            context_path = "./versions/1.21.11"
-        elif tag == "1.21.11":
-            # Use stable-first logic for version tags
-            build_result = get_latest_stable_or_experimental_build("1.21.11")
-            if not build_result or not build_result[0]:
-                return Err("No builds available for version 1.21.11")
-
-            build_number = build_result[0]
-            is_experimental = build_result[1]
-
-            if is_experimental:
-                # Use experimental-specific tag as primary
-                image_name = f"{DockerConfig.get_namespace()}/folia:1.21.11-exp{build_number}"
-                # Also create version tag as fallback (points to experimental when no stable exists)
-                version_tag = DockerConfig.get_image_name("1.21.11")
+        if spec is None:
+            spec_result = get_build_spec(tag)
+            if is_err(spec_result):
+                return spec_result
+            spec = spec_result.unwrap()
+
+        image_names = spec["tags"]
+        context_path = spec["context"]
+        build_args = []
+        for name, value in spec["args"].items():
+            build_args += ["--build-arg", f"{name}={value}"]
+
+        # Plain progress keeps get-folia.py's output, which reports jar cache hits
+        cmd = ["docker", "build", "--progress=plain"] + build_args
+        if spec["jars"]:
+            cmd += ["--build-context", f"jars={spec['jars']}"]
+        for cache in spec["cache_from"]:
+            cmd += ["--cache-from", cache]
+        for cache in spec["cache_to"]:
+            cmd += ["--cache-to", cache]
+        for image_name in image_names:
+            cmd += ["-t", image_name]
+        cmd.append(context_path)
+
+        log_path = get_log_path(tag)
+        log(tag, f"Building Docker image: {image_names[0]}")
+        for image_name in image_names[1:]:
+            log(tag, f"Also tagging as: {image_name}")
+        log(tag, f"Build context: {context_path}")
+        log(tag, f"Build args: {build_args}")
+        log(tag, f"Command: {' '.join(cmd)}")
+        log(tag, f"Log file: {log_path}")
+
+        returncode, tail = run_logged(cmd, tag, log_path)
+        if returncode != 0:
+            output = "\n".join(tail)
+            return Err(f"Docker build failed (exit code {returncode}, full log in {log_path}):\n{output}")
+        jar_cache = "prefetched" if spec["jars"] else get_jar_cache_status(log_path)
+        cached, steps = get_layer_cache_stats(log_path)
+
+        return Ok(
+            f"Docker image '{' and '.join(image_names)}' built successfully "
+            f"(jar cache: {jar_cache}, layer cache: {format_cache_rate(cached, steps)})"
+        )
+
+    except subprocess.TimeoutExpired:
+        return Err("Docker build cancelled: deadline exceeded")
+    except Exception as e:
+        return Err(f"Unexpected error: {str(e)}")
+
+
+def get_bake_target_name(tag: str) -> str:
+    """Get the bake target name of a tag; bake only allows letters, digits, "_" and "-"."""
+    return re.sub(r"[^A-Za-z0-9_-]", "-", tag)
+
+
+def generate_bake_file(specs: Dict[str, Dict]) -> str:
+    """
+    Write a buildx bake definition with one target per version.
+
+    All versions/*/Dockerfile files are identical, so building them as
+    targets of one bake runs their common stages (base image, pip install)
+    once in a single BuildKit session and the rest in parallel.
+
+    Args:
+        specs: Build specs of the targets to include, by tag (see get_build_spec)
+
+    Returns:
+        str: Path of the bake file
+    """
+    targets = {}
+    for tag, spec in specs.items():
+        target = {
+            "context": spec["context"],
+            "dockerfile": "Dockerfile",
+            "args": spec["args"],
+            "tags": spec["tags"],
+        }
+        if spec["jars"]:
+            target["contexts"] = {"jars": spec["jars"]}
+        if spec["cache_from"]:
+            target["cache-from"] = spec["cache_from"]
+        if spec["cache_to"]:
+            target["cache-to"] = spec["cache_to"]
+        targets[get_bake_target_name(tag)] = target
+
+    definition = {
+        "group": {"default": {"targets": list(targets)}},
+        "target": targets,
+    }
+
+    path = BuildConfig.get_bake_file()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(definition, f, indent=2)
+        f.write("\n")
+    os.replace(tmp_path, path)
+
+    return path
+
+
+def bake_all(
+    versions: List[str] = discover_versions(),
+    force: bool = False,
+    cache_dir: Optional[str] = None,
+    cache_ref: Optional[str] = None,
+) -> Result[str, str]:
+    """
+    Build all images with a single `docker buildx bake` (see generate_bake_file).
+
+    Each unique image is baked once and its other tags are aliased
+    afterwards (see tag_policy.py). Targets whose image already carries
+    their input fingerprint are left out unless `force` is set. The
+    output of the bake is streamed live with a "[bake]" prefix and
+    written in full to build-logs/bake.log. BuildKit caches are imported
+    and exported per target as in get_cache_options.
+    """
+    if not versions:
+        return Err("No build configurations found!")
+
+    print(f"Found {len(versions)} build configurations:")
+    for version in versions:
+        print(f" - folia/{version}")
+
+    builds, aliases, errors = get_tag_policy(versions)
+    for tag, error in errors.items():
+        print(f"❌ {tag}: {error}")
+
+    outcomes = check_up_to_date(builds, force)
+    for tag, (status, result, _) in outcomes.items():
+        print(f"⏭️ {tag}: {result.unwrap()}, skipping" if status == "skipped" else f"❌ {tag}: {result.unwrap_err()}")
+
+    pending = [tag for tag in builds if tag not in outcomes]
+    if not pending:
+        return summarize(versions, outcomes, apply_aliases(aliases, outcomes, builds), errors)
+    prefetch_jars(pending)
+
+    specs = {}
+    for tag in pending:
+        # Resolved again now that the jar may have been prefetched
+        spec_result = get_build_spec(tag, cache_dir, cache_ref, builds[tag])
+        if is_err(spec_result):
+            print(f"❌ {tag}: {spec_result.unwrap_err()}")
+            outcomes[tag] = ("failed", spec_result, 0.0)
+        else:
+            specs[tag] = spec_result.unwrap()
+
+    if not specs:
+        return summarize(versions, outcomes, apply_aliases(aliases, outcomes, builds), errors)
+
+    bake_file = generate_bake_file(specs)
+    log_path = get_log_path("bake")
+    cmd = ["docker", "buildx", "bake", "--file", bake_file, "--progress=plain", "--load"]
+    print(f"\nBaking {len(specs)} targets from {bake_file} (log in {log_path})")
+    print(f"Command: {' '.join(cmd)}\n")
+
+    started_at = time.monotonic()
+    try:
+        returncode, tail = run_logged(cmd, "bake", log_path)
+    except subprocess.TimeoutExpired:
+        return Err("Docker bake cancelled: deadline exceeded")
+    cached, steps = get_layer_cache_stats(log_path)
+    print(f"\nLayer cache: {format_cache_rate(cached, steps)}")
+    print(f"Total time: {format_duration(time.monotonic() - started_at)}\n")
+
+    if returncode != 0:
+        output = "\n".join(tail)
+        return Err(f"Docker bake failed (exit code {returncode}, full log in {log_path}):\n{output}")
+
+    for tag in specs:
+        outcomes[tag] = ("built", Ok("baked"), 0.0)
+    return summarize(versions, outcomes, apply_aliases(aliases, outcomes, builds), errors)
+
+
+def run_logged(cmd: List[str], tag: str, log_path: str) -> Tuple[int, List[str]]:
+    """
+    Run a command, streaming its output live and into a log file.
+
+    Only the last ERROR_TAIL_LINES lines are kept in memory, for the error
+    message of a failed build.
+
+    Args:
+        cmd: Command to run
+        tag: Target the output is prefixed with
+        log_path: File receiving the full output
+
+    Returns:
+        Tuple of (exit code, last lines of output)
+
+    Raises:
+        subprocess.TimeoutExpired: If the deadline passed and the command was killed
+    """
+    os.makedirs(os.path.dirname(log_path), exist_ok=True)
+    tail = deque(maxlen=ERROR_TAIL_LINES)
+    killed = threading.Event()
+
+    with open(log_path, "w", encoding="utf-8") as log_file:
+        # Own process group, so helpers still holding the output pipe are killed too
+        process = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, errors="replace",
+            start_new_session=os.name == "posix"
+        )
+
+        def kill():
+            if os.name == "posix":
+                try:
+                    os.killpg(process.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
             else:
-                # Use standard version tag for stable builds
-                image_name = DockerConfig.get_image_name("1.21.11")
-                version_tag = None
-
-            build_args = ["--build-arg", "VERSION=1.21.11", "--build-arg", f"BUILD={build_number}"]
-            context_path = "./versions/1.21.11"
-        elif tag == "latest":
-            # Build newest stable version as latest (should be dynamically determined)
-            image_name = DockerConfig.get_image_name("latest")
-            build_args = []
-            context_path = "./versions/1.21.8"
+                process.kill()
+
+        def cancel():
+            killed.set()
+            kill()
+
+        # Killed when the deadline passes, which also cancels the build
+        remaining = get_deadline().remaining()
+        timer = threading.Timer(remaining, cancel) if remaining is not None else None
+        if timer:
+            timer.start()
+
+        try:
+            for line in process.stdout:
+                log_file.write(line)
+                line = line.rstrip("\n")
+                tail.append(line)
+                log(tag, line)
+            returncode = process.wait()
+        finally:
+            if timer:
+                timer.cancel()
+            if process.poll() is None:
+                kill()
+                process.wait()
+
+    if killed.is_set():
+        raise subprocess.TimeoutExpired(cmd, remaining)
+    return returncode, list(tail)
+
+
+def get_jar_cache_status(log_path: str) -> str:
+    """
+    Get how the server jar of a build was obtained.
+
+    Args:
+        log_path: Log file with the plain-progress output of docker build
+
+    Returns:
+        str: "hit" if it came from the shared jar cache, "miss" if it was
+        downloaded, or "layer cached" if BuildKit reused the download step
+    """
+    with open(log_path, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            if "Cache hit:" in line:
+                return "hit"
+            if "Cache miss:" in line:
+                return "miss"
+    return "layer cached"
+
+
+def get_layer_cache_stats(log_path: str) -> Tuple[int, int]:
+    """
+    Count the Dockerfile steps of a build that BuildKit took from its cache.
+
+    Args:
+        log_path: Log file with the plain-progress output of docker build or bake
+
+    Returns:
+        Tuple of (cached steps, total steps)
+    """
+    steps, cached = set(), set()
+    with open(log_path, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            # Steps are announced as "#7 [jar-download 3/4] RUN ..." and, when
+            # reused, reported as "#7 CACHED"
+            match = re.match(r"#(\d+) (\[[^\]]* \d+/\d+\]|CACHED$)", line.rstrip())
+            if match:
+                (cached if match.group(2) == "CACHED" else steps).add(match.group(1))
+    return len(cached & steps), len(steps)
+
+
+def format_cache_rate(cached: int, steps: int) -> str:
+    """Format a cache hit rate as e.g. "5/7 (71%)"."""
+    if not steps:
+        return "-"
+    return f"{cached}/{steps} ({cached * 100 // steps}%)"
+
+
+def format_duration(seconds: float) -> str:
+    """Format seconds as e.g. "1m 05s"."""
+    minutes, seconds = divmod(int(round(seconds)), 60)
+    return f"{minutes}m {seconds:02d}s" if minutes else f"{seconds}s"
+
+
+def print_summary(versions: List[str], outcomes: List[Tuple[str, Optional[Result[str, str]], float]]) -> None:
+    """Print a table with the status and duration of every target."""
+    statuses = {
+        "built": "✅ built",
+        "skipped": "⏭️ up to date",
+        "aliased": "🔗 alias of",
+        "failed": "❌ failed",
+        "not started": "⏱️ not started",
+    }
+    rows = []
+    total_cached, total_steps = 0, 0
+    for version, (status, result, duration) in zip(versions, outcomes):
+        # Targets that failed before docker build was started have no log
+        if status in ("built", "failed") and os.path.exists(get_log_path(version)):
+            cached, steps = get_layer_cache_stats(get_log_path(version))
+            total_cached, total_steps = total_cached + cached, total_steps + steps
+            rows.append((
+                version, statuses[status], format_duration(duration),
+                format_cache_rate(cached, steps), get_log_path(version)
+            ))
+        elif status == "failed":
+            rows.append((version, statuses[status], format_duration(duration), "-", "-"))
+        elif status == "aliased":
+            rows.append((version, f"{statuses[status]} {result.unwrap()}", "-", "-", "-"))
         else:
-            image_name = DockerConfig.get_image_name(tag)
-            build_args = []
-            context_path = f"./versions/{tag}"
+            rows.append((version, statuses[status], "-", "-", "-"))
 
-        if not os.path.exists(context_path):
-            return Err(f"Build context path '{context_path}' does not exist")
+    headers = ("Target", "Status", "Duration", "Layer cache", "Log")
+    widths = [max(len(row[i]) for row in rows + [headers]) for i in range(len(headers))]
+    print("\nBuild summary:")
+    for row in [headers] + rows:
+        print("  " + "  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip())
+    print(f"\nLayer cache hit rate: {format_cache_rate(total_cached, total_steps)}")
 
-        # Build command with primary tag
-        cmd = ["docker", "build"] + build_args + ["-t", image_name, context_path]
 
-        # Add version tag if this is experimental (fallback behavior)
-        if version_tag:
-            cmd = ["docker", "build"] + build_args + ["-t", image_name, "-t", version_tag, context_path]
+def run_jobs(func: Callable[[str], Optional[Tuple]], tags: List[str], jobs: int) -> List[Optional[Tuple]]:
+    """Call func for every tag on a pool of at most jobs threads, returning results in tag order."""
+    if not tags:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(tags)))) as executor:
+        return list(executor.map(func, tags))
 
-        print(f"Building Docker image: {image_name}")
-        if version_tag:
-            print(f"Also tagging as: {version_tag}")
-        print(f"Build context: {context_path}")
-        print(f"Build args: {build_args if build_args else 'None'}")
-        print(f"Command: {' '.join(cmd)}")
 
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+def check_up_to_date(
+    builds: Dict[str, Dict], force: bool
+) -> Dict[str, Tuple[str, Optional[Result[str, str]], float]]:
+    """
+    Find the targets that do not need to be built, before any jar is downloaded.
 
-        tags_created = image_name
-        if version_tag:
-            tags_created = f"{image_name} and {version_tag}"
-        return Ok(f"Docker image '{tags_created}' built successfully")
+    Only the fingerprint is needed for this, so a release with nothing new
+    upstream finishes without prefetching a single jar.
 
-    except subprocess.CalledProcessError as e:
-        error_msg = f"Docker build failed: {e.stderr if e.stderr else e.stdout}"
-        return Err(error_msg)
-    except Exception as e:
-        return Err(f"Unexpected error: {str(e)}")
+    Args:
+        builds: Targets to build by tag, see tag_policy.get_tag_policy
+        force: Treat every target as outdated
+
+    Returns:
+        Outcomes of the targets that are up to date ("skipped") or cannot
+        be built ("failed"); every other target has to be built
+    """
+    def check(tag: str) -> Optional[Tuple[str, Optional[Result[str, str]], float]]:
+        spec_result = get_build_spec(tag, target=builds[tag])
+        if is_err(spec_result):
+            return "failed", spec_result, 0.0
+        skip_reason = None if force else get_skip_reason(spec_result.unwrap())
+        if skip_reason:
+            return "skipped", Ok(skip_reason), 0.0
+        return None
 
+    results = run_jobs(check, list(builds), BuildConfig.get_build_jobs())
+    return {tag: outcome for tag, outcome in zip(builds, results) if outcome is not None}
 
-def build_all(versions: List[str] = discover_versions()) -> Result[str, str]:
+
+def prefetch_jars(versions: List[str]) -> None:
+    """Download every jar up front so the builds themselves stay off the network."""
+    print("\nPrefetching jars...")
+    prefetch_result = prefetch(versions)
+    if is_ok(prefetch_result):
+        print(f"✅ {prefetch_result.unwrap()}")
+    else:
+        print(f"⚠️ {prefetch_result.unwrap_err()}; missing jars are downloaded during the build")
+
+
+def build_all(
+    versions: List[str] = discover_versions(),
+    jobs: Optional[int] = None,
+    force: bool = False,
+    cache_dir: Optional[str] = None,
+    cache_ref: Optional[str] = None,
+) -> Result[str, str]:
     """
     Build all available Docker images by auto-discovering available configurations.
+
+    Up to `jobs` images (default: BUILD_JOBS) are built at the same time,
+    so a run takes about as long as its slowest build on a builder with
+    enough cores. Targets whose local or remote image already carries
+    their input fingerprint are skipped unless `force` is set. BuildKit
+    caches are imported and exported per target as in get_cache_options.
     """
 
     if not versions:
@@ -116,25 +616,141 @@ def build_all(versions: List[str] = discover_versions()) -> Result[str, str]:
     for version in versions:
         print(f" - folia/{version}")
 
-    print("\nStarting builds...\n")
+    builds, aliases, errors = get_tag_policy(versions)
+    checked = check_up_to_date(builds, force)
+    for tag, (status, result, _) in checked.items():
+        log(tag, f"⏭️ {result.unwrap()}, skipping" if status == "skipped" else f"❌ {result.unwrap_err()}")
 
-    success_count = 0
+    pending = [tag for tag in builds if tag not in checked]
+    if pending:
+        prefetch_jars(pending)
 
-    for version in versions:
-        print(f"--- Building folia:{version} ---")
-        result = build(version)
+    jobs = max(1, min(jobs or BuildConfig.get_build_jobs(), len(pending)))
+    print(f"\nStarting {len(pending)} builds ({jobs} at a time, logs in {BuildConfig.get_build_log_dir()})...\n")
+
+    def run(tag: str) -> Tuple[str, Optional[Result[str, str]], float]:
+        # Queued builds are not started once the deadline has passed
+        if get_deadline().expired():
+            return "not started", None, 0.0
+
+        started_at = time.monotonic()
+        # Resolved again now that the jar may have been prefetched
+        spec_result = get_build_spec(tag, cache_dir, cache_ref, builds[tag])
+        if is_err(spec_result):
+            log(tag, f"❌ {spec_result.unwrap_err()}")
+            return "failed", spec_result, time.monotonic() - started_at
+
+        result = build(tag, spec_result.unwrap())
+        duration = time.monotonic() - started_at
 
         if is_ok(result):
-            print(f"✅ {result.unwrap()}")
-            success_count += 1
+            log(tag, f"✅ {result.unwrap()} in {format_duration(duration)}")
+            return "built", result, duration
+        log(tag, f"❌ {result.unwrap_err()}")
+        return "failed", result, duration
+
+    started_at = time.monotonic()
+    built = dict(zip(pending, run_jobs(run, pending, jobs)))
+    outcomes = {tag: checked.get(tag) or built[tag] for tag in builds}
+    alias_results = apply_aliases(aliases, outcomes, builds)
+    print_summary(versions, get_target_outcomes(versions, outcomes, aliases, alias_results, errors))
+    print(f"\nTotal time: {format_duration(time.monotonic() - started_at)}\n")
+
+    return summarize(versions, outcomes, alias_results, errors)
+
+
+def apply_aliases(
+    aliases: Dict[str, str],
+    outcomes: Dict[str, Tuple[str, Optional[Result[str, str]], float]],
+    builds: Dict[str, Dict],
+) -> Dict[str, Result[str, str]]:
+    """
+    Tag the aliases of every image that was built or is up to date.
+
+    A skipped image is only tagged locally if the local image carries the
+    current fingerprint. Images that are only up to date in the registry
+    (the local one may be missing or stale) are left alone; push.py copies
+    their aliases in the registry instead.
+
+    Args:
+        aliases: {alias tag: built tag}, see tag_policy.apply_tag_policy
+        outcomes: Build outcomes by built tag
+        builds: Targets to build by tag, see tag_policy.get_tag_policy
+
+    Returns:
+        Dict[str, Result[str, str]]: Result of every alias
+    """
+    results = {}
+    for alias, source in aliases.items():
+        status = outcomes.get(source, ("failed", None, 0.0))[0]
+        if status not in ("built", "skipped"):
+            results[alias] = Err(f"{source} was not built")
+        elif status == "skipped" and not is_local_image_current(source, builds[source]):
+            results[alias] = Ok(f"{source} is only up to date in the registry, push.py copies the alias there")
         else:
-            print(f"❌ {result.unwrap_err()}")
-        print()
+            results[alias] = tag_alias(alias, source)
+
+        if is_ok(results[alias]):
+            log(alias, f"🔗 {results[alias].unwrap()}")
+        else:
+            log(alias, f"❌ {results[alias].unwrap_err()}")
+    return results
+
+
+def is_local_image_current(tag: str, target: Dict) -> bool:
+    """Check if the local image of a tag carries the current fingerprint of its target."""
+    return get_image_fingerprint(DockerConfig.get_image_name(tag)) == get_fingerprint(target)
+
+
+def get_target_outcomes(
+    versions: List[str],
+    outcomes: Dict[str, Tuple[str, Optional[Result[str, str]], float]],
+    aliases: Dict[str, str],
+    alias_results: Dict[str, Result[str, str]],
+    errors: Dict[str, str],
+) -> List[Tuple[str, Optional[Result[str, str]], float]]:
+    """Get the outcome of every requested target, whether it was built, aliased or not resolved."""
+    target_outcomes = []
+    for version in versions:
+        if version in outcomes:
+            target_outcomes.append(outcomes[version])
+        elif version in errors:
+            target_outcomes.append(("failed", Err(errors[version]), 0.0))
+        else:
+            result = alias_results[version]
+            status = "aliased" if is_ok(result) else "failed"
+            target_outcomes.append((status, Ok(aliases[version]) if is_ok(result) else result, 0.0))
+    return target_outcomes
+
+
+def summarize(
+    versions: List[str],
+    outcomes: Dict[str, Tuple[str, Optional[Result[str, str]], float]],
+    alias_results: Dict[str, Result[str, str]],
+    errors: Dict[str, str],
+) -> Result[str, str]:
+    """Get the overall result of a build run from its built and aliased targets."""
+    statuses = [status for status, _, _ in outcomes.values()]
+    alias_errors = [alias for alias, result in alias_results.items() if is_err(result)]
+    not_started = [tag for tag, (status, _, _) in outcomes.items() if status == "not started"]
+    succeeded = (
+        f"{statuses.count('built')} built, {statuses.count('skipped')} up to date, "
+        f"{len(alias_results) - len(alias_errors)} aliases tagged"
+    )
 
-    if success_count < len(versions):
-        return Err(f"Build incomplete: only {success_count}/{len(versions)} succeeded")
-    return Ok(f"Build complete: {success_count}/{len(versions)} succeeded")
+    problems = []
+    if errors:
+        problems.append(f"{len(errors)} not resolved ({', '.join(errors)})")
+    if statuses.count("failed"):
+        problems.append(f"{statuses.count('failed')} failed")
+    if not_started:
+        problems.append(f"{len(not_started)} not started before the deadline ({', '.join(not_started)})")
+    if alias_errors:
+        problems.append(f"{len(alias_errors)} aliases not tagged ({', '.join(alias_errors)})")
 
+    if problems:
+        return Err(f"Build incomplete for {len(versions)} targets: {succeeded}; {'; '.join(problems)}")
+    return Ok(f"Build complete for {len(versions)} targets: {succeeded}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,197 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from config import PaperMCConfig
+from deadline import DeadlineExceeded, get_deadline
+from papermc_client import PaperMCClient, fetch_concurrently, get_client
+
+
+class BuildCatalog:
+    """
+    Persisted catalog of every Folia version and build.
+
+    Each build records its channel, timestamp and application jar sha256.
+    Refreshes are incremental: a version's build list is revalidated (a 304
+    when unchanged) and only builds newer than the highest recorded one are
+    fetched.
+    """
+
+    def __init__(self, path: Optional[str] = None, client: Optional[PaperMCClient] = None):
+        self.path = path or PaperMCConfig.get_catalog_path()
+        self.client = client or get_client()
+        self.data = {"refreshed_at": 0, "versions": {}}
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self) -> None:
+        """Load the catalog from disk, keeping an empty catalog if none exists."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if isinstance(data.get("versions"), dict):
+            self.data = data
+
+    def save(self) -> None:
+        """Atomically write the catalog to disk."""
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self.data, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def is_stale(self, max_age: Optional[float] = None) -> bool:
+        """Check whether the catalog is older than max_age seconds."""
+        if max_age is None:
+            max_age = PaperMCConfig.get_catalog_max_age()
+        return time.time() - self.data.get("refreshed_at", 0) > max_age
+
+    def refresh(self) -> int:
+        """
+        Incrementally refresh the catalog from the PaperMC API and save it.
+
+        Returns:
+            Number of newly recorded builds
+
+        Raises:
+            requests.RequestException: If the version list cannot be fetched
+            DeadlineExceeded: If the deadline passes; versions refreshed until then are saved
+        """
+        versions = self.client.get_versions()
+        try:
+            new_counts = fetch_concurrently(self._refresh_version, versions)
+        except DeadlineExceeded:
+            # Keep what was recorded so far; refreshed_at is not bumped, so
+            # the next run picks up where this one stopped
+            with self._lock:
+                known = self.data["versions"]
+                self.data["versions"] = {v: known[v] for v in versions if v in known}
+            self.save()
+            raise
+
+        with self._lock:
+            # Keep versions in API order (oldest first)
+            known = self.data["versions"]
+            self.data["versions"] = {v: known.get(v, {"builds": {}}) for v in versions}
+            self.data["refreshed_at"] = time.time()
+
+        self.save()
+        return sum(new_counts)
+
+    def _refresh_version(self, version: str) -> int:
+        with self._lock:
+            recorded = dict(self.data["versions"].get(version, {}).get("builds", {}))
+
+        highest = max((int(b) for b in recorded), default=0)
+        build_numbers = self.client.get_version(version).get("builds", [])
+        new_numbers = [b for b in build_numbers if int(b) > highest]
+
+        if not new_numbers:
+            return 0
+
+        if recorded:
+            # Only the builds we have not seen yet, each an immutable document
+            build_docs = fetch_concurrently(
+                lambda b: self.client.get_build(version, str(b)), new_numbers
+            )
+        else:
+            build_docs = self.client.get_builds(version)
+
+        for build_doc in build_docs:
+            application = build_doc.get("downloads", {}).get("application", {})
+            recorded[str(build_doc["build"])] = {
+                "channel": build_doc.get("channel"),
+                "time": build_doc.get("time"),
+                "sha256": application.get("sha256"),
+            }
+
+        ordered = {b: recorded[b] for b in sorted(recorded, key=int)}
+        with self._lock:
+            self.data["versions"][version] = {"builds": ordered}
+
+        return len(new_numbers)
+
+    def get_versions(self) -> List[str]:
+        """Get every cataloged version, oldest first."""
+        return list(self.data["versions"])
+
+    def has_version(self, version: str) -> bool:
+        """Check whether a version is cataloged."""
+        return version in self.data["versions"]
+
+    def get_build_channels(self, version: str) -> List[Tuple[str, Optional[str]]]:
+        """Get (build_number, channel) for every build of a version, oldest first."""
+        builds = self.data["versions"].get(version, {}).get("builds", {})
+        return [(build_num, info.get("channel")) for build_num, info in builds.items()]
+
+    def get_build(self, version: str, build: str) -> Optional[dict]:
+        """Get the recorded channel, time and sha256 of a build."""
+        return self.data["versions"].get(version, {}).get("builds", {}).get(str(build))
+
+
+_catalog: Optional[BuildCatalog] = None
+_catalog_lock = threading.Lock()
+# time.time() of the last refresh attempt, so a failing API is not retried on every call
+_catalog_attempted_at = 0.0
+
+
+def get_catalog() -> BuildCatalog:
+    """
+    Get the process-wide build catalog, refreshing it whenever it is stale.
+
+    Staleness is checked on every call, so a long-running process picks
+    up new builds once FOLIA_CATALOG_MAX_AGE has passed. A failed refresh
+    is reported and the previously stored catalog is used; it is retried
+    once another FOLIA_CATALOG_MAX_AGE has passed.
+    """
+    global _catalog, _catalog_attempted_at
+    with _catalog_lock:
+        if _catalog is None:
+            _catalog = BuildCatalog()
+
+        max_age = PaperMCConfig.get_catalog_max_age()
+        if _catalog.is_stale(max_age) and time.time() - _catalog_attempted_at > max_age:
+            _catalog_attempted_at = time.time()
+            try:
+                new_builds = _catalog.refresh()
+                print(f"Build catalog refreshed: {new_builds} new builds")
+            except Exception as e:
+                print(f"Warning: could not refresh build catalog: {e}")
+        return _catalog
+
+
+def main():
+    get_deadline()
+    catalog = BuildCatalog()
+    try:
+        new_builds = catalog.refresh()
+    except DeadlineExceeded as e:
+        new_builds = None
+        print(f"Catalog refresh incomplete: {e}; builds recorded until then were saved")
+
+    print(f"Catalog: {catalog.path}")
+    if new_builds is not None:
+        print(f"New builds recorded: {new_builds}")
+    for version in catalog.get_versions():
+        builds = catalog.get_build_channels(version)
+        latest = f"{builds[-1][0]} ({builds[-1][1]})" if builds else "none"
+        print(f" - {version}: {len(builds)} builds, latest {latest}")
+
+    if new_builds is None:
+        exit(1)
+
+
+if __name__ == "__main__":
+    main()
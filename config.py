@@ -1,5 +1,5 @@
 import os
-from typing import Optional
+from typing import List, Optional
 
 class DockerConfig:
     """Centralized configuration for Docker image naming and build settings."""
@@ -49,6 +49,72 @@ class BuildConfig:
         """Check if experimental versions should be auto-synced."""
         return os.environ.get('AUTO_SYNC_EXPERIMENTAL', 'true').lower() == 'true'
 
+    @staticmethod
+    def get_plan_path() -> str:
+        """Get the path of the build plan lockfile."""
+        default = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'build-plan.json')
+        return os.environ.get('FOLIA_BUILD_PLAN', default)
+
+    @staticmethod
+    def is_plan_pinned() -> bool:
+        """Check if the build plan lockfile was chosen explicitly with FOLIA_BUILD_PLAN."""
+        return bool(os.environ.get('FOLIA_BUILD_PLAN'))
+
+    @staticmethod
+    def get_plan_max_age() -> Optional[float]:
+        """Get the age (seconds) after which the default build plan is ignored, or None for no limit."""
+        max_age = float(os.environ.get('FOLIA_BUILD_PLAN_MAX_AGE', '86400'))
+        return max_age if max_age > 0 else None
+
+    @staticmethod
+    def get_deadline() -> Optional[float]:
+        """Get the total time budget (seconds) of a command, or None for no limit."""
+        budget = float(os.environ.get('FOLIA_DEADLINE', '0'))
+        return budget if budget > 0 else None
+
+    @staticmethod
+    def get_build_jobs() -> int:
+        """Get how many images build.py builds at the same time."""
+        return max(1, int(os.environ.get('BUILD_JOBS', str(os.cpu_count() or 1))))
+
+    @staticmethod
+    def get_build_log_dir() -> str:
+        """Get the directory that full per-target build logs are written to."""
+        default = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'build-logs')
+        return os.environ.get('FOLIA_BUILD_LOG_DIR', default)
+
+    @staticmethod
+    def get_cache_dir() -> Optional[str]:
+        """Get the local directory BuildKit caches are imported from and exported to, if any."""
+        return os.environ.get('BUILD_CACHE_DIR') or None
+
+    @staticmethod
+    def get_cache_ref() -> Optional[str]:
+        """Get the registry image BuildKit caches are imported from and exported to, if any."""
+        return os.environ.get('BUILD_CACHE_REF') or None
+
+    @staticmethod
+    def force_build() -> bool:
+        """Check if build.py rebuilds images that already carry their input fingerprint."""
+        return os.environ.get('BUILD_FORCE', 'false').lower() == 'true'
+
+    @staticmethod
+    def use_bake() -> bool:
+        """Check if build.py builds all images with one docker buildx bake."""
+        return os.environ.get('BUILD_BAKE', 'false').lower() == 'true'
+
+    @staticmethod
+    def get_bake_file() -> str:
+        """Get the path build.py writes the generated bake definition to."""
+        default = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'docker-bake.json')
+        return os.environ.get('FOLIA_BAKE_FILE', default)
+
+    @staticmethod
+    def get_jar_cache_dir() -> str:
+        """Get the content-addressed cache that prefetched jars are stored in."""
+        default = os.path.join(PaperMCConfig.get_cache_dir(), 'jars')
+        return os.environ.get('FOLIA_JAR_CACHE', default)
+
 
 class VersionConfig:
     """Configuration for version management."""
@@ -83,4 +149,140 @@ class VersionConfig:
     @staticmethod
     def get_experimental_channel_name() -> str:
         """Get the experimental channel name."""
-        return "experimental"
\ No newline at end of file
+        return "experimental"
+
+class PaperMCConfig:
+    """Configuration for PaperMC API access."""
+
+    @staticmethod
+    def get_api_url() -> str:
+        """Get the PaperMC API base URL (without the project path)."""
+        return os.environ.get('PAPERMC_API_URL', 'https://api.papermc.io/v2').rstrip('/')
+
+    @staticmethod
+    def get_mirrors() -> List[str]:
+        """Get the API base URLs to use, in order of preference (default: only the API URL)."""
+        mirrors = os.environ.get('PAPERMC_MIRRORS', '')
+        urls = [url.strip().rstrip('/') for url in mirrors.split(',') if url.strip()]
+        return urls or [PaperMCConfig.get_api_url()]
+
+    @staticmethod
+    def get_hedge_delay() -> float:
+        """Get the seconds before a request is hedged to another mirror, until latency samples exist."""
+        return float(os.environ.get('PAPERMC_HEDGE_DELAY', '1'))
+
+    @staticmethod
+    def get_mirror_cooldown() -> float:
+        """Get the seconds a failed mirror is skipped for."""
+        return float(os.environ.get('PAPERMC_MIRROR_COOLDOWN', '30'))
+
+    @staticmethod
+    def get_project() -> str:
+        """Get the PaperMC project name."""
+        return os.environ.get('PAPERMC_PROJECT', 'folia')
+
+    @staticmethod
+    def get_user_agent() -> str:
+        """Get the User-Agent sent with every PaperMC request."""
+        return os.environ.get('PAPERMC_USER_AGENT', 'folia-docker (+https://github.com/Pablo-Barros/folia-docker)')
+
+    @staticmethod
+    def get_connect_timeout() -> float:
+        """Get the connect timeout in seconds for PaperMC requests."""
+        return float(os.environ.get('PAPERMC_CONNECT_TIMEOUT', '5'))
+
+    @staticmethod
+    def get_read_timeout() -> float:
+        """Get the read timeout in seconds for PaperMC requests."""
+        return float(os.environ.get('PAPERMC_READ_TIMEOUT', '30'))
+
+    @staticmethod
+    def get_pool_size() -> int:
+        """Get the maximum number of pooled keep-alive connections."""
+        return int(os.environ.get('PAPERMC_POOL_SIZE', '16'))
+
+    @staticmethod
+    def is_http_cache_enabled() -> bool:
+        """Check if PaperMC responses should be cached on disk."""
+        return os.environ.get('PAPERMC_HTTP_CACHE', 'true').lower() == 'true'
+
+    @staticmethod
+    def get_cache_dir() -> str:
+        """Get the directory for on-disk PaperMC caches."""
+        default = os.path.join(os.path.expanduser('~'), '.cache', 'folia-docker')
+        return os.environ.get('PAPERMC_CACHE_DIR', default)
+
+    @staticmethod
+    def get_max_concurrency() -> int:
+        """Get the maximum number of concurrent PaperMC requests."""
+        return int(os.environ.get('PAPERMC_MAX_CONCURRENCY', '8'))
+
+    @staticmethod
+    def get_catalog_path() -> str:
+        """Get the path of the persisted Folia build catalog."""
+        default = os.path.join(PaperMCConfig.get_cache_dir(), 'catalog.json')
+        return os.environ.get('FOLIA_CATALOG_PATH', default)
+
+    @staticmethod
+    def get_catalog_max_age() -> float:
+        """Get how long (seconds) the catalog is trusted before it is refreshed."""
+        return float(os.environ.get('FOLIA_CATALOG_MAX_AGE', '300'))
+
+    @staticmethod
+    def get_memo_max_size() -> int:
+        """Get the maximum number of memoized build metadata lookups."""
+        return int(os.environ.get('PAPERMC_MEMO_MAX_SIZE', '1024'))
+
+    @staticmethod
+    def get_memo_ttl() -> float:
+        """Get how long (seconds) successful lookups stay memoized."""
+        return float(os.environ.get('PAPERMC_MEMO_TTL', '3600'))
+
+    @staticmethod
+    def get_memo_negative_ttl() -> float:
+        """Get how long (seconds) failed lookups stay memoized."""
+        return float(os.environ.get('PAPERMC_MEMO_NEGATIVE_TTL', '30'))
+
+    @staticmethod
+    def get_rate_limit() -> float:
+        """Get the sustained PaperMC request rate (requests per second)."""
+        return float(os.environ.get('PAPERMC_RATE_LIMIT', '10'))
+
+    @staticmethod
+    def get_rate_burst() -> int:
+        """Get how many PaperMC requests may be sent in a burst."""
+        return int(os.environ.get('PAPERMC_RATE_BURST', '20'))
+
+    @staticmethod
+    def get_max_retries() -> int:
+        """Get how often a throttled or failed PaperMC request is retried."""
+        return int(os.environ.get('PAPERMC_MAX_RETRIES', '4'))
+
+    @staticmethod
+    def get_backoff_base() -> float:
+        """Get the base delay (seconds) of the exponential retry backoff."""
+        return float(os.environ.get('PAPERMC_BACKOFF_BASE', '0.5'))
+
+    @staticmethod
+    def get_backoff_max() -> float:
+        """Get the maximum delay (seconds) between retries."""
+        return float(os.environ.get('PAPERMC_BACKOFF_MAX', '30'))
+
+
+class ProxyConfig:
+    """Configuration for the PaperMC pull-through proxy."""
+
+    @staticmethod
+    def get_host() -> str:
+        """Get the address the proxy listens on."""
+        return os.environ.get('PAPERMC_PROXY_HOST', '0.0.0.0')
+
+    @staticmethod
+    def get_port() -> int:
+        """Get the port the proxy listens on."""
+        return int(os.environ.get('PAPERMC_PROXY_PORT', '8080'))
+
+    @staticmethod
+    def get_metadata_ttl() -> float:
+        """Get how long (seconds) mutable metadata is served before asking upstream again."""
+        return float(os.environ.get('PAPERMC_PROXY_METADATA_TTL', '60'))
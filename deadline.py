@@ -0,0 +1,90 @@
+import threading
+import time
+from typing import Optional, Tuple
+
+from config import BuildConfig
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when a command has used up its time budget."""
+
+
+class Deadline:
+    """
+    Total time budget of a command (FOLIA_DEADLINE seconds).
+
+    Network calls derive their connect/read timeouts from the remaining
+    budget, waits between retries are cut short, and subprocesses are
+    killed once it runs out, so a hung PaperMC, GitHub or Docker call can
+    no longer stall a job until the CI runner's own timeout. Without a
+    budget every call keeps its configured timeout.
+    """
+
+    def __init__(self, budget: Optional[float] = None):
+        self.budget = budget if budget and budget > 0 else None
+        self.expires_at = time.monotonic() + self.budget if self.budget else None
+
+    def remaining(self) -> Optional[float]:
+        """Get the seconds left, or None without a budget."""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        """Check whether the budget has run out."""
+        return self.remaining() == 0.0
+
+    def check(self) -> None:
+        """
+        Raises:
+            DeadlineExceeded: If the budget has run out
+        """
+        if self.expired():
+            raise DeadlineExceeded(f"Deadline of {self.budget:g}s exceeded")
+
+    def timeout(self, connect: float, read: float) -> Tuple[float, float]:
+        """
+        Get request timeouts that end no later than the deadline.
+
+        Raises:
+            DeadlineExceeded: If the budget has run out
+        """
+        self.check()
+        remaining = self.remaining()
+        if remaining is None:
+            return connect, read
+        return min(connect, remaining), min(read, remaining)
+
+    def sleep(self, seconds: float) -> None:
+        """
+        Sleep before a retry, unless the deadline would pass first.
+
+        Raises:
+            DeadlineExceeded: If the retry could not happen before the deadline
+        """
+        remaining = self.remaining()
+        if remaining is not None and seconds >= remaining:
+            raise DeadlineExceeded(f"Deadline of {self.budget:g}s exceeded while waiting to retry")
+        time.sleep(seconds)
+
+
+_deadline: Optional[Deadline] = None
+_deadline_lock = threading.Lock()
+
+
+def get_deadline() -> Deadline:
+    """Get the process-wide deadline, starting the budget on first use."""
+    global _deadline
+    if _deadline is None:
+        with _deadline_lock:
+            if _deadline is None:
+                _deadline = Deadline(BuildConfig.get_deadline())
+    return _deadline
+
+
+def set_deadline(budget: Optional[float]) -> Deadline:
+    """Start a new process-wide budget of `budget` seconds (None for no limit)."""
+    global _deadline
+    with _deadline_lock:
+        _deadline = Deadline(budget)
+    return _deadline
@@ -0,0 +1,101 @@
+import hashlib
+import json
+import os
+import subprocess
+from typing import Dict, List, Optional
+
+from deadline import get_deadline
+
+# Image label carrying the fingerprint of the inputs an image was built from
+FINGERPRINT_LABEL = "net.endkind.folia.fingerprint"
+
+# Files of a build context that end up in (or decide the contents of) the image
+FINGERPRINT_FILES = ("Dockerfile", "entrypoint.sh", "requirements.txt", "get-folia.py")
+
+
+def get_fingerprint(target: Dict) -> str:
+    """
+    Get the input fingerprint of a build target.
+
+    It covers the build context files in FINGERPRINT_FILES and the pinned
+    version, build, channel and jar sha256, so it changes exactly when a
+    rebuild could produce a different image. Base image updates are not
+    covered; use build.py --force to pick those up.
+
+    Args:
+        target: Pinned target from the build plan
+
+    Returns:
+        str: Hex sha256 of the inputs
+    """
+    files = {}
+    for name in FINGERPRINT_FILES:
+        path = os.path.join(target["context"], name)
+        if os.path.isfile(path):
+            with open(path, "rb") as f:
+                files[name] = hashlib.sha256(f.read()).hexdigest()
+
+    inputs = {
+        "version": target["version"],
+        "build": str(target["build"]),
+        "channel": target["channel"],
+        "sha256": target.get("sha256") or "",
+        "files": files,
+    }
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode()).hexdigest()
+
+
+def get_image_fingerprint(image_name: str, remote: bool = False) -> Optional[str]:
+    """
+    Get the fingerprint label of an existing image.
+
+    Args:
+        image_name: Full image name including the tag
+        remote: Inspect the image in its registry instead of the local image store
+
+    Returns:
+        Optional[str]: The fingerprint, or None if the image does not exist,
+        has no fingerprint or cannot be inspected
+    """
+    if remote:
+        cmd = ["docker", "buildx", "imagetools", "inspect", "--format", "{{json .Image}}", image_name]
+    else:
+        cmd = ["docker", "image", "inspect", "--format", "{{json .Config.Labels}}", image_name]
+
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=get_deadline().remaining())
+        if result.returncode != 0:
+            return None
+        data = json.loads(result.stdout) or {}
+    except (subprocess.TimeoutExpired, OSError, ValueError):
+        return None
+
+    if remote:
+        # Multi-platform images are reported as {platform: image config}
+        configs = [data] if "config" in data else list(data.values())
+        labels = {}
+        for config in configs:
+            labels = (config or {}).get("config", {}).get("Labels") or {}
+            if labels:
+                break
+    else:
+        labels = data
+
+    return labels.get(FINGERPRINT_LABEL)
+
+
+def find_current_image(image_names: List[str], fingerprint: str) -> Optional[str]:
+    """
+    Find where all tags of a target already carry its fingerprint.
+
+    Args:
+        image_names: Full image names of the target
+        fingerprint: Fingerprint of the target's inputs
+
+    Returns:
+        Optional[str]: "local" or "remote", or None if the target has to be built
+    """
+    for location, remote in (("local", False), ("remote", True)):
+        if all(get_image_fingerprint(name, remote) == fingerprint for name in image_names):
+            return location
+    return None
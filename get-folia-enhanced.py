@@ -1,13 +1,177 @@
 #!/usr/bin/env python3
 
 import argparse
+import glob
+import hashlib
 import os
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
 
 import requests
+from requests.adapters import HTTPAdapter
 from result import Err, Ok, Result, is_err
 
+API_URL = (os.environ.get("PAPERMC_API_URL") or "https://api.papermc.io/v2").rstrip("/")
+MIRRORS = [
+    url.strip().rstrip("/") for url in os.environ.get("PAPERMC_MIRRORS", "").split(",") if url.strip()
+] or [API_URL]
+BASE_URLS = [f"{mirror}/projects/folia" for mirror in MIRRORS]
+BASE_URL = BASE_URLS[0]
+USER_AGENT = os.environ.get(
+    "PAPERMC_USER_AGENT", "folia-docker (+https://github.com/Pablo-Barros/folia-docker)"
+)
+TIMEOUT = (
+    float(os.environ.get("PAPERMC_CONNECT_TIMEOUT", "5")),
+    float(os.environ.get("PAPERMC_READ_TIMEOUT", "30")),
+)
+MAX_RETRIES = int(os.environ.get("PAPERMC_MAX_RETRIES", "4"))
+BACKOFF_BASE = float(os.environ.get("PAPERMC_BACKOFF_BASE", "0.5"))
+BACKOFF_MAX = float(os.environ.get("PAPERMC_BACKOFF_MAX", "30"))
+# Throttled and server error responses that are worth retrying
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+CHUNK_SIZE = 1024 * 1024
+MIB = 1024 * 1024
+MIN_SEGMENT_SIZE = 4 * MIB
+MAX_CONNECTIONS = 16
+# time.monotonic() by which the whole run has to finish (--deadline), None for no limit
+DEADLINE = None
+
+
+def create_session() -> requests.Session:
+    """
+    Create the keep-alive session shared by every PaperMC request.
+
+    The session itself does not retry; api_get and the download loops do,
+    so every wait stays within BACKOFF_MAX and the deadline.
+    """
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_maxsize=MAX_CONNECTIONS))
+    session.mount("http://", HTTPAdapter(pool_maxsize=MAX_CONNECTIONS))
+    session.headers["User-Agent"] = USER_AGENT
+    return session
+
+
+session = create_session()
+
+
+class DeadlineExceeded(Exception):
+    """Raised when the run has used up its time budget"""
+
+
+def check_deadline() -> None:
+    if DEADLINE is not None and time.monotonic() >= DEADLINE:
+        raise DeadlineExceeded("Deadline exceeded")
+
+
+def request_timeout() -> tuple:
+    """Get (connect, read) timeouts that end no later than the deadline"""
+    check_deadline()
+    if DEADLINE is None:
+        return TIMEOUT
+    remaining = DEADLINE - time.monotonic()
+    return min(TIMEOUT[0], remaining), min(TIMEOUT[1], remaining)
+
+
+def is_retryable(error: requests.RequestException) -> bool:
+    """Check if a failed request is worth retrying: connection problems, throttling and server errors"""
+    if isinstance(error, requests.HTTPError):
+        return error.response is not None and error.response.status_code in RETRY_STATUSES
+    return isinstance(error, (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError))
+
+
+def get_retry_after(response):
+    """Get the delay in seconds a response's Retry-After header asks for, or None"""
+    value = response.headers.get("Retry-After", "").strip() if response is not None else ""
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def sleep_before_retry(attempt: int, retry_after: float = None) -> None:
+    """
+    Back off exponentially before a retry, or as long as the server's
+    Retry-After asks, but never longer than BACKOFF_MAX and never past the deadline.
+    """
+    delay = min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt) if retry_after is None else retry_after)
+    if DEADLINE is not None and time.monotonic() + delay >= DEADLINE:
+        raise DeadlineExceeded("Deadline exceeded while waiting to retry")
+    time.sleep(delay)
+
+
+def rank_mirrors() -> None:
+    """
+    Probe every mirror concurrently and prefer the fastest one that answers.
+
+    Unreachable mirrors are moved to the end rather than dropped, so they
+    are still tried if every other mirror fails later on.
+    """
+    global BASE_URL, BASE_URLS
+
+    def probe(base_url: str) -> float:
+        started_at = time.monotonic()
+        try:
+            requests.get(base_url, headers={"User-Agent": USER_AGENT}, timeout=request_timeout()).raise_for_status()
+        except (requests.RequestException, DeadlineExceeded):
+            return float("inf")
+        return time.monotonic() - started_at
+
+    with ThreadPoolExecutor(max_workers=len(BASE_URLS)) as executor:
+        latencies = list(executor.map(probe, BASE_URLS))
+
+    BASE_URLS = [url for _, _, url in sorted(zip(latencies, range(len(BASE_URLS)), BASE_URLS))]
+    BASE_URL = BASE_URLS[0]
+    fastest = min(latencies)
+    if fastest == float("inf"):
+        print("Warning: no mirror answered the probe, keeping the configured order")
+    else:
+        print(f"Using mirror {BASE_URL} ({fastest * 1000:.0f} ms)")
+
+
+def get_base_urls() -> list:
+    """Get the project URLs to try, the preferred mirror first"""
+    return [BASE_URL] + [url for url in BASE_URLS if url != BASE_URL]
+
+
+def api_get(path: str = "") -> requests.Response:
+    """
+    GET a path below the project URL, failing over to the next mirror when
+    one cannot be reached, is throttled or answers with a server error.
+
+    Once every mirror has been tried, failed requests are retried up to
+    MAX_RETRIES times with backoff, see sleep_before_retry.
+    """
+    base_urls = get_base_urls()
+    attempts = MAX_RETRIES + len(base_urls)
+    for attempt in range(attempts):
+        base_url = base_urls[attempt % len(base_urls)]
+        is_last = attempt == attempts - 1
+        retry_after = None
+        try:
+            response = session.get(f"{base_url}{path}", timeout=request_timeout())
+            if response.status_code not in RETRY_STATUSES or is_last:
+                return response
+            retry_after = get_retry_after(response)
+            reason = f"HTTP {response.status_code}"
+        except requests.RequestException as e:
+            if is_last:
+                raise
+            reason = str(e)
+        next_url = base_urls[(attempt + 1) % len(base_urls)]
+        print(f"Mirror {base_url} failed ({reason}), {f'trying {next_url}' if next_url != base_url else 'retrying'}")
+        if attempt + 1 >= len(base_urls):
+            sleep_before_retry(attempt + 1 - len(base_urls), retry_after)
+
 
 def main():
+    global DEADLINE
+
     parser = argparse.ArgumentParser(
         description="Enhanced Folia Download Script - Supports Experimental Builds"
     )
@@ -41,8 +205,42 @@ def main():
         help="Output file path (Default: server.jar)",
     )
 
+    parser.add_argument(
+        "--sha256",
+        type=str,
+        default=os.environ.get("SHA256", ""),
+        help="Expected jar sha256 (Default: environment variable SHA256 or the build document)",
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=os.environ.get("FOLIA_JAR_CACHE", ""),
+        help="Content-addressed jar cache directory (Default: environment variable FOLIA_JAR_CACHE, disabled if empty)",
+    )
+
+    parser.add_argument(
+        "--connections",
+        type=int,
+        default=int(os.environ.get("FOLIA_DOWNLOAD_CONNECTIONS", "1")),
+        help=f"Parallel range requests per download, up to {MAX_CONNECTIONS} (Default: environment variable FOLIA_DOWNLOAD_CONNECTIONS or 1)",
+    )
+
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        default=float(os.environ.get("FOLIA_DEADLINE") or 0),
+        help="Total time budget in seconds; requests and retries stop when it runs out (Default: environment variable FOLIA_DEADLINE, no limit if 0)",
+    )
+
     args = parser.parse_args()
 
+    if args.deadline > 0:
+        DEADLINE = time.monotonic() + args.deadline
+
+    if len(BASE_URLS) > 1:
+        rank_mirrors()
+
     if args.version == "latest":
         version_result = get_latest_version(args.channel)
         if is_err(version_result):
@@ -65,40 +263,340 @@ def main():
     print(f"Build: {build}")
     print(f"Channel: {args.channel}")
 
-    download_result = download_folia(version, build, args.output)
+    download_result = download_folia(
+        version, build, args.output, args.sha256 or None, args.cache_dir or None, args.connections
+    )
     if is_err(download_result):
         print(f"Error: {download_result.unwrap_err()}")
         exit(1)
 
 
 def download_folia(
-    version: str, build: str, output: str = "server.jar"
+    version: str,
+    build: str,
+    output: str = "server.jar",
+    sha256: str = None,
+    cache_dir: str = None,
+    connections: int = 1,
 ) -> Result[None, str]:
-    base_url = "https://api.papermc.io/v2/projects/folia"
-    download_url = f"{base_url}/versions/{version}/builds/{build}/downloads/folia-{version}-{build}.jar"
+    """
+    Stream the server jar to disk in fixed-size chunks, verifying its sha256.
+
+    The expected digest comes from the sha256 argument or the build document.
+    An existing output that already matches it is kept without downloading,
+    and a jar with that digest in the content-addressed cache_dir is copied
+    from there. Otherwise the jar is hashed while it is written to
+    "<output>.<digest>.part" and only renamed to output once the digest
+    matches, so memory use stays flat and output never holds a truncated or
+    corrupt jar. Downloaded jars are added to cache_dir.
+
+    An interrupted transfer keeps its part file and is resumed with an HTTP
+    Range request, both on the next retry and on the next invocation. The
+    part file is named after the first 16 hex digits of the expected sha256,
+    so only a transfer of the same jar is ever resumed; part files left by
+    other jars are removed. The completed file is checked against the
+    expected size and sha256.
+
+    With connections > 1 and a server that advertises "Accept-Ranges: bytes",
+    the jar is split into byte ranges that are fetched concurrently into a
+    preallocated "<output>.<digest>.segments" and hashed once complete. Otherwise, or if a
+    segment fails, the jar is downloaded as a single stream.
+    """
+    download_urls = [
+        f"{base_url}/versions/{version}/builds/{build}/downloads/folia-{version}-{build}.jar"
+        for base_url in get_base_urls()
+    ]
+
+    expected_sha256 = sha256
+    if not expected_sha256:
+        sha256_result = get_expected_sha256(version, build)
+        if is_err(sha256_result):
+            return sha256_result
+        expected_sha256 = sha256_result.unwrap()
+    expected_sha256 = expected_sha256.lower()
+    part_path = f"{output}.{expected_sha256[:16]}.part"
 
     try:
+        if os.path.isfile(output) and file_sha256(output) == expected_sha256:
+            print(f"Up to date: {os.path.basename(output)} (sha256 {expected_sha256[:12]}), skipping download")
+            return Ok(None)
+
         output_dir = os.path.dirname(output)
         if output_dir:
             os.makedirs(output_dir, exist_ok=True)
 
-        response = requests.get(download_url)
-        response.raise_for_status()
-
-        with open(output, "wb") as f:
-            f.write(response.content)
-
-        print(f"Downloaded: {os.path.basename(output)}")
+        for stale_path in glob.glob(f"{glob.escape(output)}.*.part"):
+            if stale_path != part_path:
+                os.remove(stale_path)
+
+        cached_path = get_cached_jar_path(cache_dir, expected_sha256) if cache_dir else None
+        if cached_path and os.path.isfile(cached_path):
+            if file_sha256(cached_path) == expected_sha256:
+                shutil.copyfile(cached_path, part_path)
+                os.replace(part_path, output)
+                print(f"Cache hit: {os.path.basename(output)} (sha256 {expected_sha256[:12]})")
+                return Ok(None)
+            os.remove(cached_path)
+
+        started_at = time.monotonic()
+        bytes_written = 0
+        sha256_hex = None
+
+        connections = max(1, min(connections, MAX_CONNECTIONS))
+        if connections > 1 and hasattr(os, "pwrite") and not os.path.isfile(part_path):
+            total_size = get_ranged_size(download_urls[0])
+            if total_size is None:
+                print("Server does not support range requests, using a single stream")
+            elif total_size >= 2 * MIN_SEGMENT_SIZE:
+                connections = min(connections, total_size // MIN_SEGMENT_SIZE)
+                # Segments leave holes until every range is written, so they go
+                # to a separate file that the resume logic never picks up
+                segments_path = f"{output}.{expected_sha256[:16]}.segments"
+                try:
+                    bytes_written = download_segments(download_urls[0], segments_path, total_size, connections)
+                    sha256_hex = file_sha256(segments_path)
+                    os.replace(segments_path, part_path)
+                except DeadlineExceeded:
+                    if os.path.exists(segments_path):
+                        os.remove(segments_path)
+                    raise
+                except (requests.RequestException, OSError) as e:
+                    print(f"Segmented download failed ({e}), falling back to a single stream")
+                    if os.path.exists(segments_path):
+                        os.remove(segments_path)
+                    bytes_written = 0
+
+        if sha256_hex is None:
+            # Every mirror gets at least one attempt, on top of the retries
+            attempts = MAX_RETRIES + len(download_urls)
+            for attempt in range(attempts):
+                before = os.path.getsize(part_path) if os.path.isfile(part_path) else 0
+                try:
+                    # Each retry moves on to the next mirror and resumes the partial file there
+                    download_url = download_urls[attempt % len(download_urls)]
+                    transferred, sha256_hex, total_size = stream_to_part(download_url, part_path)
+                    bytes_written += transferred
+                    break
+                except requests.RequestException as e:
+                    if not is_retryable(e):
+                        raise
+                    after = os.path.getsize(part_path) if os.path.isfile(part_path) else 0
+                    bytes_written += max(0, after - before)
+                    if attempt == attempts - 1:
+                        return Err(f"Error downloading: {e} (partial download kept in {part_path})")
+                    print(f"Download interrupted after {after / MIB:.1f} MiB ({e}), retrying")
+                    sleep_before_retry(attempt, get_retry_after(e.response))
+
+        part_size = os.path.getsize(part_path)
+        if total_size is not None and part_size != total_size:
+            os.remove(part_path)
+            return Err(f"Size mismatch for folia-{version}-{build}.jar: expected {total_size} bytes, got {part_size}")
+
+        if sha256_hex != expected_sha256:
+            os.remove(part_path)
+            return Err(
+                f"Checksum mismatch for folia-{version}-{build}.jar: "
+                f"expected {expected_sha256}, got {sha256_hex}"
+            )
+
+        os.replace(part_path, output)
+
+        if cached_path:
+            store_cached_jar(output, cached_path)
+            print(f"Cache miss: stored sha256 {expected_sha256[:12]} in {cache_dir}")
+
+        elapsed = max(time.monotonic() - started_at, 1e-6)
+        print(
+            f"Downloaded: {os.path.basename(output)} "
+            f"({bytes_written / MIB:.1f} MiB in {elapsed:.1f}s, {bytes_written / MIB / elapsed:.1f} MiB/s, "
+            f"sha256 {expected_sha256[:12]} verified)"
+        )
         return Ok(None)
+    except DeadlineExceeded as e:
+        if os.path.exists(part_path):
+            return Err(f"Error downloading: {e} (partial download kept in {part_path})")
+        return Err(f"Error downloading: {e}")
     except Exception as e:
         return Err(f"Error downloading: {e}")
 
 
-def get_latest_version(channel: str = "default") -> Result[str, str]:
-    base_url = "https://api.papermc.io/v2/projects/folia"
+def get_ranged_size(download_url: str):
+    """
+    Get the size of a download if the server accepts byte range requests.
+
+    Returns:
+        Size in bytes, or None if ranges are not advertised or the size is unknown
+    """
+    try:
+        response = session.head(
+            download_url, headers={"Accept-Encoding": "identity"}, timeout=request_timeout(), allow_redirects=True
+        )
+        response.raise_for_status()
+    except requests.RequestException:
+        return None
+
+    content_length = response.headers.get("Content-Length", "")
+    if response.headers.get("Accept-Ranges", "").lower() != "bytes" or not content_length.isdigit():
+        return None
+    return int(content_length)
+
+
+def download_segments(download_url: str, path: str, total_size: int, connections: int) -> int:
+    """
+    Download a file as concurrent byte ranges into a preallocated file.
+
+    Each segment is written at its own offset with os.pwrite, and a segment
+    interrupted part-way is resumed from where it stopped.
+
+    Returns:
+        Bytes transferred
+
+    Raises:
+        requests.RequestException: If a segment still fails after MAX_RETRIES
+    """
+    segment_size = -(-total_size // connections)
+    segments = [
+        (start, min(start + segment_size, total_size) - 1)
+        for start in range(0, total_size, segment_size)
+    ]
+    print(f"Downloading {total_size / MIB:.1f} MiB in {len(segments)} segments")
 
+    fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
     try:
-        response = requests.get(base_url)
+        os.ftruncate(fd, total_size)
+        with ThreadPoolExecutor(max_workers=len(segments)) as executor:
+            futures = [
+                executor.submit(download_segment, download_url, fd, start, end)
+                for start, end in segments
+            ]
+            return sum(future.result() for future in futures)
+    finally:
+        os.close(fd)
+
+
+def download_segment(download_url: str, fd: int, start: int, end: int) -> int:
+    """Download bytes start..end (inclusive) of a file and write them at their offset in fd"""
+    position = start
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            headers = {"Range": f"bytes={position}-{end}", "Accept-Encoding": "identity"}
+            with session.get(download_url, headers=headers, timeout=request_timeout(), stream=True) as response:
+                response.raise_for_status()
+                if response.status_code != 206 or not response.headers.get("Content-Range", "").startswith(
+                    f"bytes {position}-"
+                ):
+                    raise requests.RequestException(f"Server ignored range {position}-{end}")
+
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    check_deadline()
+                    chunk = chunk[: end + 1 - position]
+                    os.pwrite(fd, chunk, position)
+                    position += len(chunk)
+
+            if position > end:
+                return end + 1 - start
+            raise requests.exceptions.ChunkedEncodingError(f"Segment {start}-{end} ended early at {position}")
+        except requests.RequestException as e:
+            if attempt == MAX_RETRIES or not is_retryable(e):
+                raise
+            sleep_before_retry(attempt, get_retry_after(e.response))
+
+
+def stream_to_part(download_url: str, part_path: str) -> tuple:
+    """
+    Stream a download into part_path, resuming an existing partial file.
+
+    Returns:
+        Tuple of (bytes transferred, sha256 of the whole file, expected total size or None)
+
+    Raises:
+        requests.RequestException: If the transfer fails; part_path keeps what was received
+    """
+    offset = os.path.getsize(part_path) if os.path.isfile(part_path) else 0
+    headers = {"Accept-Encoding": "identity"}
+    if offset:
+        headers["Range"] = f"bytes={offset}-"
+
+    with session.get(download_url, headers=headers, timeout=request_timeout(), stream=True) as response:
+        if offset and response.status_code == 416:
+            # Nothing left to fetch; the caller verifies what we have
+            total_size = response.headers.get("Content-Range", "").rpartition("/")[2]
+            return 0, file_sha256(part_path), int(total_size) if total_size.isdigit() else None
+
+        response.raise_for_status()
+        digest = hashlib.sha256()
+
+        if offset and response.status_code == 206:
+            print(f"Resuming download at {offset / MIB:.1f} MiB")
+            update_digest_from_file(digest, part_path)
+            mode = "ab"
+            total_size = response.headers.get("Content-Range", "").rpartition("/")[2]
+            total_size = int(total_size) if total_size.isdigit() else None
+        else:
+            if offset:
+                print("Server ignored the range request, restarting download")
+            mode = "wb"
+            content_length = response.headers.get("Content-Length")
+            total_size = int(content_length) if content_length and content_length.isdigit() else None
+
+        transferred = 0
+        with open(part_path, mode) as f:
+            for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                check_deadline()
+                f.write(chunk)
+                digest.update(chunk)
+                transferred += len(chunk)
+
+    return transferred, digest.hexdigest(), total_size
+
+
+def update_digest_from_file(digest, path: str) -> None:
+    """Feed a file into a hash object in fixed-size chunks"""
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+
+
+def file_sha256(path: str) -> str:
+    """Hash a file in fixed-size chunks"""
+    digest = hashlib.sha256()
+    update_digest_from_file(digest, path)
+    return digest.hexdigest()
+
+
+def get_cached_jar_path(cache_dir: str, sha256: str) -> str:
+    """Get the content-addressed cache path of a jar"""
+    return os.path.join(cache_dir, "sha256", f"{sha256}.jar")
+
+
+def store_cached_jar(path: str, cached_path: str) -> None:
+    """Atomically copy a verified jar into the cache"""
+    os.makedirs(os.path.dirname(cached_path), exist_ok=True)
+    tmp_path = f"{cached_path}.{os.getpid()}.tmp"
+    try:
+        shutil.copyfile(path, tmp_path)
+        os.replace(tmp_path, cached_path)
+    except OSError as e:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        print(f"Warning: could not store jar in cache: {e}")
+
+
+def get_expected_sha256(version: str, build: str) -> Result[str, str]:
+    """Get the sha256 of a build's application jar from its build document"""
+    details_result = get_build_details(version, build)
+    if is_err(details_result):
+        return details_result
+
+    sha256 = details_result.unwrap().get("downloads", {}).get("application", {}).get("sha256")
+    if not sha256:
+        return Err(f"No sha256 published for {version} build {build}")
+    return Ok(sha256)
+
+
+def get_latest_version(channel: str = "default") -> Result[str, str]:
+    try:
+        response = api_get()
         response.raise_for_status()
         data = response.json()
         versions = data["versions"]
@@ -115,10 +613,9 @@ def get_latest_version(channel: str = "default") -> Result[str, str]:
 
 
 def get_latest_build(version: str, channel: str = "default") -> Result[str, str]:
-    base_url = "https://api.papermc.io/v2/projects/folia"
-
     try:
-        response = requests.get(f"{base_url}/versions/{version}")
+        # The bulk builds listing carries the channel of every build
+        response = api_get(f"/versions/{version}/builds")
         response.raise_for_status()
         data = response.json()
 
@@ -141,17 +638,15 @@ def get_latest_build(version: str, channel: str = "default") -> Result[str, str]
                 return Err(f"No {channel} builds found for version {version}")
 
         # For "default" channel, return the last build
-        return Ok(str(builds[-1]))
+        return Ok(str(builds[-1]["build"]))
     except Exception as e:
         return Err(f"Error getting latest build for version {version}: {e}")
 
 
 def get_build_details(version: str, build: str) -> Result[dict, str]:
     """Get detailed information about a specific build."""
-    base_url = "https://api.papermc.io/v2/projects/folia"
-
     try:
-        response = requests.get(f"{base_url}/versions/{version}/builds/{build}")
+        response = api_get(f"/versions/{version}/builds/{build}")
         response.raise_for_status()
         return Ok(response.json())
     except Exception as e:
@@ -0,0 +1,91 @@
+import hashlib
+import json
+import os
+import tempfile
+from typing import Optional
+
+
+class HTTPCache:
+    """
+    On-disk cache for JSON responses, keyed by URL.
+
+    Each entry keeps the response validators (ETag / Last-Modified) so it can
+    be revalidated with a conditional request. Entries stored as immutable are
+    served without revalidation.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+
+    def _path(self, url: str) -> str:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def load(self, url: str) -> Optional[dict]:
+        """
+        Load the cached entry for a URL.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            Entry with 'body', 'etag', 'last_modified' and 'immutable', or None
+        """
+        try:
+            with open(self._path(url), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if entry.get("url") != url:
+            return None
+        return entry
+
+    def store(
+        self,
+        url: str,
+        body,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        immutable: bool = False,
+    ) -> None:
+        """
+        Store a response body with its validators.
+
+        Responses without validators are only worth keeping when immutable,
+        since they could never be revalidated.
+        """
+        if not (etag or last_modified or immutable):
+            return
+
+        entry = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "immutable": immutable,
+            "body": body,
+        }
+        path = self._path(url)
+
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(entry, f)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            print(f"Warning: could not write HTTP cache entry for {url}: {e}")
+
+    @staticmethod
+    def conditional_headers(entry: dict) -> dict:
+        """Build the revalidation headers for a cached entry."""
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
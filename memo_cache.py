@@ -0,0 +1,108 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional
+
+from single_flight import SingleFlight
+
+
+class MemoCache:
+    """
+    Bounded, thread-safe memoization cache with separate TTLs for failures.
+
+    Successful results live for `ttl` seconds, failures (loader exceptions or
+    values flagged by `is_failure`) only for `negative_ttl` seconds, so a
+    transient error is retried soon instead of being remembered forever.
+    The least recently used entry is evicted once `max_size` is reached.
+    Concurrent misses for the same key run the loader only once.
+    """
+
+    def __init__(self, max_size: int, ttl: float, negative_ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "negative_hits": 0, "misses": 0, "evictions": 0}
+        self._loading = SingleFlight()
+
+    def _lookup(self, key: Hashable):
+        """Return the live (value, error) entry for key, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+
+            value, error, expires_at, negative = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                self._stats["misses"] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._stats["negative_hits" if negative else "hits"] += 1
+            return value, error
+
+    def _store(self, key: Hashable, value, error: Optional[BaseException], negative: bool) -> None:
+        ttl = self.negative_ttl if negative else self.ttl
+        with self._lock:
+            self._entries[key] = (value, error, time.monotonic() + ttl, negative)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def put(self, key: Hashable, value) -> None:
+        """Store a successful result."""
+        self._store(key, value, None, negative=False)
+
+    def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], object],
+        is_failure: Optional[Callable[[object], bool]] = None,
+    ):
+        """
+        Get a memoized result, calling loader on a miss.
+
+        Args:
+            key: Cache key
+            loader: Zero-argument function producing the value
+            is_failure: Optional predicate marking a returned value as a failure
+
+        Returns:
+            The memoized or freshly loaded value
+
+        Raises:
+            Exception: The loader's exception, also replayed for memoized failures
+        """
+        entry = self._lookup(key)
+        if entry is not None:
+            value, error = entry
+            if error is not None:
+                raise error
+            return value
+
+        def load():
+            try:
+                value = loader()
+            except Exception as e:
+                self._store(key, None, e, negative=True)
+                raise
+
+            negative = bool(is_failure and is_failure(value))
+            self._store(key, value, None, negative=negative)
+            return value
+
+        return self._loading.do(key, load)
+
+    def clear(self) -> None:
+        """Drop every entry, keeping the statistics."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Get hit/miss/eviction counters and the current size."""
+        with self._lock:
+            return {**self._stats, "size": len(self._entries)}
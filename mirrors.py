@@ -0,0 +1,106 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+import requests
+
+
+class MirrorPool:
+    """
+    Ordered list of PaperMC API mirrors ranked by observed latency.
+
+    Each mirror keeps a rolling window of response times. Healthy mirrors
+    are preferred fastest first (median latency, configured order breaking
+    ties); a mirror that failed is skipped until its cooldown expires. The
+    p95 of a mirror's latency is how long a request to it may take before
+    it is hedged to the next mirror.
+    """
+
+    def __init__(
+        self,
+        urls: List[str],
+        hedge_delay: float,
+        cooldown: float = 30.0,
+        window: int = 100,
+        min_samples: int = 5,
+    ):
+        self.urls = [url.rstrip("/") for url in urls]
+        self.default_hedge_delay = hedge_delay
+        self.cooldown = cooldown
+        self.min_samples = min_samples
+        self._samples: Dict[str, deque] = {url: deque(maxlen=window) for url in self.urls}
+        self._failed_until: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._probe_lock = threading.Lock()
+        self._probed = False
+
+    def record(self, url: str, latency: float) -> None:
+        """Record a successful response time and mark the mirror healthy."""
+        with self._lock:
+            self._samples[url].append(latency)
+            self._failed_until.pop(url, None)
+
+    def mark_failed(self, url: str) -> None:
+        """Skip a mirror until its cooldown expires."""
+        with self._lock:
+            self._failed_until[url] = time.monotonic() + self.cooldown
+
+    def is_healthy(self, url: str) -> bool:
+        with self._lock:
+            return self._failed_until.get(url, 0) <= time.monotonic()
+
+    def _percentile(self, url: str, fraction: float) -> Optional[float]:
+        with self._lock:
+            samples = sorted(self._samples[url])
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, int(fraction * len(samples)))]
+
+    def ranked(self) -> List[str]:
+        """Get the mirrors in order of preference: healthy and fast first."""
+        def key(item):
+            position, url = item
+            median = self._percentile(url, 0.5)
+            return (not self.is_healthy(url), median if median is not None else float("inf"), position)
+
+        return [url for _, url in sorted(enumerate(self.urls), key=key)]
+
+    def hedge_delay(self, url: str) -> float:
+        """Get how long to wait for a mirror before hedging: its p95, or the default until enough samples exist."""
+        with self._lock:
+            enough = len(self._samples[url]) >= self.min_samples
+        if not enough:
+            return self.default_hedge_delay
+        return self._percentile(url, 0.95)
+
+    def probe(self, fetch: Callable[[str], object]) -> None:
+        """
+        Measure every mirror once, concurrently.
+
+        Args:
+            fetch: Function requesting a cheap document from a mirror URL;
+                raising or returning a non-2xx response marks it failed
+        """
+        def probe_one(url: str) -> None:
+            started_at = time.monotonic()
+            try:
+                response = fetch(url)
+                if isinstance(response, requests.Response):
+                    response.raise_for_status()
+            except Exception:
+                self.mark_failed(url)
+                return
+            self.record(url, time.monotonic() - started_at)
+
+        with ThreadPoolExecutor(max_workers=len(self.urls)) as executor:
+            list(executor.map(probe_one, self.urls))
+        self._probed = True
+
+    def ensure_probed(self, fetch: Callable[[str], object]) -> None:
+        """Probe the mirrors on first use when there is more than one."""
+        if len(self.urls) > 1 and not self._probed:
+            with self._probe_lock:
+                if not self._probed:
+                    self.probe(fetch)
@@ -0,0 +1,337 @@
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Iterable, List, Optional, TypeVar
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config import PaperMCConfig
+from deadline import get_deadline
+from http_cache import HTTPCache
+from mirrors import MirrorPool
+from rate_limit import AdaptiveConcurrency, TokenBucket, backoff_delay, parse_retry_after
+from single_flight import SingleFlight
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class PaperMCClient:
+    """
+    Shared HTTP client for the PaperMC API.
+
+    All lookups go through a single keep-alive session with a bounded
+    connection pool, so repeated calls reuse TCP/TLS connections instead of
+    paying a new handshake per request. JSON responses are kept in an
+    on-disk cache and revalidated with conditional requests.
+
+    Requests are paced by a token bucket, and throttled (429) or failed
+    (5xx, connection errors) requests are retried with jittered exponential
+    backoff, honoring Retry-After. Throttling also shrinks the number of
+    requests allowed in flight at once. Concurrent lookups of the same URL,
+    from threads or asyncio tasks, share a single request.
+
+    With several mirrors (PAPERMC_MIRRORS) they are probed on first use and
+    requests go to the fastest healthy one. A request still unanswered after
+    that mirror's p95 latency is hedged to the next mirror and the first
+    good response wins; a mirror that fails is skipped for a cooldown.
+    Cache keys and download URLs always use the first configured mirror.
+
+    Timeouts and retry waits are cut to the command's remaining deadline
+    (FOLIA_DEADLINE), after which requests raise DeadlineExceeded.
+    """
+
+    def __init__(
+        self,
+        api_url: Optional[str] = None,
+        project: Optional[str] = None,
+        user_agent: Optional[str] = None,
+        timeout: Optional[tuple] = None,
+        pool_size: Optional[int] = None,
+        cache: Optional[HTTPCache] = None,
+        mirrors: Optional[List[str]] = None,
+    ):
+        self.mirrors = MirrorPool(
+            mirrors or ([api_url] if api_url else PaperMCConfig.get_mirrors()),
+            hedge_delay=PaperMCConfig.get_hedge_delay(),
+            cooldown=PaperMCConfig.get_mirror_cooldown(),
+        )
+        self.api_url = self.mirrors.urls[0]
+        self.project = project or PaperMCConfig.get_project()
+        self.project_url = f"{self.api_url}/projects/{self.project}"
+        self.timeout = timeout or (
+            PaperMCConfig.get_connect_timeout(),
+            PaperMCConfig.get_read_timeout(),
+        )
+
+        pool_size = pool_size or PaperMCConfig.get_pool_size()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "User-Agent": user_agent or PaperMCConfig.get_user_agent(),
+            "Accept": "application/json",
+        })
+
+        if cache is None and PaperMCConfig.is_http_cache_enabled():
+            cache = HTTPCache(os.path.join(PaperMCConfig.get_cache_dir(), "http"))
+        self.cache = cache
+
+        self.rate_limiter = TokenBucket(PaperMCConfig.get_rate_limit(), PaperMCConfig.get_rate_burst())
+        self.concurrency = AdaptiveConcurrency(PaperMCConfig.get_max_concurrency())
+        self.max_retries = PaperMCConfig.get_max_retries()
+
+        self._in_flight = SingleFlight()
+        self._hedge_executor = ThreadPoolExecutor(max_workers=pool_size)
+
+        self.request_count = 0
+        self.retry_count = 0
+        self.hedge_count = 0
+        self._stats_lock = threading.Lock()
+
+    def _send(
+        self, url: str, headers: Optional[dict] = None, mirror: Optional[str] = None
+    ) -> requests.Response:
+        """
+        Send a GET request, retrying throttled and failed attempts.
+
+        The latency of a successful response is recorded for mirror, and
+        the mirror is marked failed when the last attempt fails.
+
+        Returns:
+            The final response; its status may still be an error after the last retry
+
+        Raises:
+            requests.RequestException: If the last attempt fails to connect
+            DeadlineExceeded: If the deadline passes before a response arrives
+        """
+        deadline = get_deadline()
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire()
+
+            with self.concurrency:
+                with self._stats_lock:
+                    self.request_count += 1
+                try:
+                    response = self.session.get(url, headers=headers, timeout=deadline.timeout(*self.timeout))
+                except (requests.ConnectionError, requests.Timeout) as e:
+                    if attempt == self.max_retries:
+                        if mirror:
+                            self.mirrors.mark_failed(mirror)
+                        raise
+                    delay = backoff_delay(
+                        attempt, PaperMCConfig.get_backoff_base(), PaperMCConfig.get_backoff_max()
+                    )
+                    print(f"Request to {url} failed ({e}), retrying in {delay:.1f}s")
+                    response = None
+
+            if response is not None:
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    self.concurrency.on_success()
+                    if mirror:
+                        self.mirrors.record(mirror, response.elapsed.total_seconds())
+                    return response
+
+                if response.status_code == 429:
+                    self.concurrency.on_throttle()
+                if attempt == self.max_retries:
+                    if mirror:
+                        self.mirrors.mark_failed(mirror)
+                    return response
+
+                delay = backoff_delay(
+                    attempt,
+                    PaperMCConfig.get_backoff_base(),
+                    PaperMCConfig.get_backoff_max(),
+                    parse_retry_after(response.headers.get("Retry-After")),
+                )
+                print(f"Request to {url} returned {response.status_code}, retrying in {delay:.1f}s")
+
+            with self._stats_lock:
+                self.retry_count += 1
+            deadline.sleep(delay)
+
+    def _mirror_url(self, mirror: str, path: str) -> str:
+        return f"{mirror}/projects/{self.project}{path}"
+
+    def _request(self, path: str, headers: Optional[dict] = None) -> requests.Response:
+        """
+        Send a GET request for a project path to the preferred mirror.
+
+        Returns:
+            The first good response, or the last error response if every mirror failed
+
+        Raises:
+            requests.RequestException: If no mirror could be reached
+        """
+        self.mirrors.ensure_probed(
+            lambda mirror: self.session.get(
+                self._mirror_url(mirror, ""), timeout=get_deadline().timeout(*self.timeout)
+            )
+        )
+        ranked = self.mirrors.ranked()
+        if len(ranked) == 1:
+            return self._send(self._mirror_url(ranked[0], path), headers, ranked[0])
+
+        remaining = list(ranked)
+        pending = {}
+
+        def launch(healthy_only: bool = False) -> bool:
+            if not remaining or (healthy_only and not self.mirrors.is_healthy(remaining[0])):
+                return False
+            mirror = remaining.pop(0)
+            future = self._hedge_executor.submit(self._send, self._mirror_url(mirror, path), headers, mirror)
+            pending[future] = mirror
+            return True
+
+        launch()
+        hedge_after = self.mirrors.hedge_delay(ranked[0])
+        last_response = None
+        last_error = None
+
+        while pending:
+            done, _ = wait(pending, timeout=hedge_after, return_when=FIRST_COMPLETED)
+            if not done:
+                # Slower than this mirror's p95: race one more healthy mirror against it
+                hedge_after = None
+                if launch(healthy_only=True):
+                    with self._stats_lock:
+                        self.hedge_count += 1
+                continue
+
+            for future in done:
+                del pending[future]
+                try:
+                    response = future.result()
+                except requests.RequestException as e:
+                    last_error = e
+                    launch()
+                    continue
+
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    return response
+                last_response = response
+                launch()
+
+        if last_response is not None:
+            return last_response
+        raise last_error
+
+    def get_json(self, path: str = "", immutable: bool = False) -> dict:
+        """
+        Fetch a JSON document relative to the project URL.
+
+        Cached documents are revalidated with If-None-Match / If-Modified-Since,
+        so an unchanged document costs a 304 without a body. Immutable
+        documents are served from the cache without any request. Concurrent
+        callers of the same URL share one pending request and its result,
+        which must therefore not be mutated.
+
+        Args:
+            path: Path below the project URL (e.g., "/versions/1.21.11")
+            immutable: Whether the document never changes once published
+
+        Returns:
+            Parsed JSON document
+
+        Raises:
+            requests.RequestException: On connection errors or non-2xx responses
+        """
+        url = f"{self.project_url}{path}"
+        return self._in_flight.do(url, lambda: self._fetch_json(path, url, immutable))
+
+    async def get_json_async(self, path: str = "", immutable: bool = False) -> dict:
+        """Asyncio variant of `get_json`, sharing in-flight requests with threaded callers."""
+        url = f"{self.project_url}{path}"
+        return await self._in_flight.do_async(url, lambda: self._fetch_json(path, url, immutable))
+
+    def _fetch_json(self, path: str, url: str, immutable: bool) -> dict:
+        entry = self.cache.load(url) if self.cache else None
+
+        if entry and entry["immutable"]:
+            return entry["body"]
+
+        headers = HTTPCache.conditional_headers(entry) if entry else {}
+        response = self._request(path, headers)
+
+        if entry and response.status_code == 304:
+            return entry["body"]
+
+        response.raise_for_status()
+        data = response.json()
+
+        if self.cache:
+            self.cache.store(
+                url,
+                data,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                immutable=immutable,
+            )
+        return data
+
+    def get_versions(self) -> List[str]:
+        """Get all versions of the project, oldest first."""
+        return self.get_json().get("versions", [])
+
+    def get_version(self, version: str) -> dict:
+        """Get the version document, which lists its build numbers."""
+        return self.get_json(f"/versions/{version}")
+
+    def get_builds(self, version: str) -> List[dict]:
+        """Get every build of a version, including its channel, in one request."""
+        return self.get_json(f"/versions/{version}/builds").get("builds", [])
+
+    def get_build(self, version: str, build: str) -> dict:
+        """Get the document of a single build, which never changes once published."""
+        return self.get_json(f"/versions/{version}/builds/{build}", immutable=True)
+
+    def get_download_url(self, version: str, build: str) -> str:
+        """Get the download URL of the application jar of a build."""
+        file_name = f"{self.project}-{version}-{build}.jar"
+        return f"{self.project_url}/versions/{version}/builds/{build}/downloads/{file_name}"
+
+
+_client: Optional[PaperMCClient] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> PaperMCClient:
+    """Get the process-wide PaperMC client, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = PaperMCClient()
+    return _client
+
+
+def fetch_concurrently(
+    func: Callable[[T], R], items: Iterable[T], max_workers: Optional[int] = None
+) -> List[R]:
+    """
+    Call func for every item in parallel on a bounded thread pool.
+
+    Results are returned in the order of items, regardless of which request
+    finishes first, so callers can merge them deterministically.
+
+    Args:
+        func: Function to call for each item (e.g., a per-version lookup)
+        items: Items to fan out over
+        max_workers: Concurrency cap (default: PAPERMC_MAX_CONCURRENCY)
+
+    Returns:
+        List of results, one per item, in input order
+    """
+    items = list(items)
+    if not items:
+        return []
+
+    max_workers = max(1, min(max_workers or PaperMCConfig.get_max_concurrency(), len(items)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(func, items))
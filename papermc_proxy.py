@@ -0,0 +1,241 @@
+import hashlib
+import json
+import os
+import re
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Tuple
+
+import requests
+from result import is_err
+
+from config import PaperMCConfig, ProxyConfig
+from deadline import set_deadline
+from memo_cache import MemoCache
+from papermc_client import PaperMCClient, get_client
+from prefetch import download_jar, get_jar_path
+from single_flight import SingleFlight
+
+METADATA_PATH = re.compile(r"^/v2/projects/(?P<project>[^/]+)(?P<path>(/versions/[^/]+(/builds(/\d+)?)?)?)/?$")
+JAR_PATH = re.compile(
+    r"^/v2/projects/(?P<project>[^/]+)/versions/(?P<version>[^/]+)/builds/(?P<build>\d+)/downloads/(?P<file>[^/]+)$"
+)
+BUILD_PATH = re.compile(r"^/versions/[^/]+/builds/\d+$")
+
+
+class UpstreamError(Exception):
+    """Error answering a request, carrying the HTTP status to send"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class PaperMCProxy:
+    """
+    Pull-through cache for the subset of the PaperMC v2 API this repository uses.
+
+    Metadata is fetched through the shared PaperMC client (on-disk HTTP cache,
+    conditional revalidation, rate limiting) and served from memory for
+    PAPERMC_PROXY_METADATA_TTL seconds; build documents never change and are
+    kept until evicted. Jars are stored by sha256 in the same content-addressed
+    cache prefetch.py uses and verified before they are served. Concurrent
+    misses for the same document or jar go upstream once.
+    """
+
+    def __init__(self, client: Optional[PaperMCClient] = None, metadata_ttl: Optional[float] = None):
+        self.client = client or get_client()
+        self.metadata = MemoCache(
+            PaperMCConfig.get_memo_max_size(),
+            metadata_ttl if metadata_ttl is not None else ProxyConfig.get_metadata_ttl(),
+            PaperMCConfig.get_memo_negative_ttl(),
+        )
+        self._jar_downloads = SingleFlight()
+
+    def get_metadata(self, path: str) -> dict:
+        """
+        Get a JSON document below the project URL.
+
+        Raises:
+            UpstreamError: If upstream does not know the document or cannot be reached
+        """
+        def load():
+            try:
+                return self.client.get_json(path, immutable=bool(BUILD_PATH.match(path)))
+            except requests.HTTPError as e:
+                status = e.response.status_code if e.response is not None else 502
+                raise UpstreamError(404 if status == 404 else 502, str(e))
+            except requests.RequestException as e:
+                raise UpstreamError(502, str(e))
+
+        return self.metadata.get_or_load(path, load)
+
+    def get_jar(self, version: str, build: str, file_name: str) -> Tuple[str, str]:
+        """
+        Get the local path of a build's application jar, downloading it on a miss.
+
+        Returns:
+            Tuple of (path, sha256)
+
+        Raises:
+            UpstreamError: If the jar does not exist or could not be downloaded
+        """
+        build_info = self.get_metadata(f"/versions/{version}/builds/{build}")
+        application = build_info.get("downloads", {}).get("application", {})
+        if application.get("name") != file_name or not application.get("sha256"):
+            raise UpstreamError(404, f"Unknown download {file_name}")
+
+        sha256 = application["sha256"]
+        path = get_jar_path(sha256)
+        if os.path.isfile(path):
+            return path, sha256
+
+        def download():
+            result = download_jar({"version": version, "build": build, "sha256": sha256})
+            if is_err(result):
+                raise UpstreamError(502, result.unwrap_err())
+            return result.unwrap()
+
+        return self._jar_downloads.do(sha256, download), sha256
+
+
+class ProxyRequestHandler(BaseHTTPRequestHandler):
+    """Serves metadata and jars from the PaperMCProxy attached to the server"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.handle_request(send_body=True)
+
+    def do_HEAD(self):
+        self.handle_request(send_body=False)
+
+    def handle_request(self, send_body: bool):
+        proxy: PaperMCProxy = self.server.proxy
+        path = self.path.split("?", 1)[0]
+
+        try:
+            jar_match = JAR_PATH.match(path)
+            metadata_match = METADATA_PATH.match(path)
+            match = jar_match or metadata_match
+            if not match or match["project"] != proxy.client.project:
+                raise UpstreamError(404, f"Not found: {path}")
+
+            if jar_match:
+                jar = proxy.get_jar(jar_match["version"], jar_match["build"], jar_match["file"])
+            else:
+                document = proxy.get_metadata(metadata_match["path"])
+        except UpstreamError as e:
+            self.send_error(e.status, str(e))
+            return
+        except Exception as e:
+            # Anything else is still an upstream failure to the client, not a dropped connection
+            self.log_error("Error answering %s: %r", path, e)
+            self.send_error(502, str(e))
+            return
+
+        if jar_match:
+            self.send_jar(*jar, send_body)
+        else:
+            self.send_json(document, send_body)
+
+    def send_json(self, document: dict, send_body: bool):
+        body = json.dumps(document).encode()
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def send_jar(self, path: str, sha256: str, send_body: bool):
+        size = os.path.getsize(path)
+        byte_range = parse_range(self.headers.get("Range"), size)
+
+        if byte_range is False:
+            self.send_response(416)
+            self.send_header("Content-Range", f"bytes */{size}")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        start, end = byte_range or (0, size - 1)
+        self.send_response(206 if byte_range else 200)
+        if byte_range:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        self.send_header("Content-Type", "application/java-archive")
+        self.send_header("Content-Length", str(end - start + 1))
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", f'"{sha256}"')
+        self.end_headers()
+
+        if send_body:
+            with open(path, "rb") as f:
+                f.seek(start)
+                remaining = end - start + 1
+                while remaining > 0:
+                    chunk = f.read(min(1024 * 1024, remaining))
+                    if not chunk:
+                        break
+                    self.wfile.write(chunk)
+                    remaining -= len(chunk)
+
+
+def parse_range(value: Optional[str], size: int):
+    """
+    Parse a single-range Range header.
+
+    Returns:
+        (start, end) inclusive, None to send the whole file, or False if unsatisfiable
+    """
+    match = re.fullmatch(r"bytes=(\d*)-(\d*)", (value or "").strip())
+    if not match or match.group(1) == match.group(2) == "":
+        return None
+
+    first, last = match.groups()
+    if first == "":
+        start, end = max(0, size - int(last)), size - 1
+    else:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+
+    if start >= size or start > end:
+        return False
+    return start, end
+
+
+def create_server(host: str, port: int, proxy: Optional[PaperMCProxy] = None) -> ThreadingHTTPServer:
+    """Create the proxy HTTP server; call serve_forever() to run it."""
+    # A long-running service: FOLIA_DEADLINE budgets one-shot commands, not every request
+    set_deadline(None)
+    server = ThreadingHTTPServer((host, port), ProxyRequestHandler)
+    server.daemon_threads = True
+    server.proxy = proxy or PaperMCProxy()
+    return server
+
+
+def main():
+    server = create_server(ProxyConfig.get_host(), ProxyConfig.get_port())
+    host, port = server.server_address[:2]
+    print(f"PaperMC proxy for {server.proxy.client.api_url} listening on http://{host}:{port}/v2")
+    print(f"Point clients at it with PAPERMC_API_URL=http://<this host>:{port}/v2")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
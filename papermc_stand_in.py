@@ -0,0 +1,179 @@
+"""
+Local stand-in for the PaperMC API, shared by the test scripts.
+
+A StandInPaperMC server serves a single Folia build (1.21.8 build 1) with
+the given jar. It can answer slowly, cut jar transfers short and serve or
+ignore byte ranges, and it records what it was asked for.
+"""
+
+import hashlib
+import importlib.util
+import json
+import os
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+VERSION = "1.21.8"
+BUILD = 1
+JAR_NAME = f"folia-{VERSION}-{BUILD}.jar"
+JAR_PATH = f"/versions/{VERSION}/builds/{BUILD}/downloads/{JAR_NAME}"
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Answers PaperMC API requests from the state of its StandInPaperMC server"""
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_body(self, data, content_type):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def send_json(self, body):
+        self.send_body(json.dumps(body).encode(), "application/json")
+
+    def do_GET(self):
+        server = self.server
+        path = self.path.split("/projects/folia", 1)[-1]
+        with server.lock:
+            server.hits[path] += 1
+        time.sleep(server.delay)
+
+        if path == "":
+            self.send_json({"project_id": "folia", "versions": [VERSION]})
+        elif path == f"/versions/{VERSION}/builds":
+            self.send_json({"builds": [server.build]})
+        elif path == f"/versions/{VERSION}/builds/{BUILD}":
+            self.send_json(server.build)
+        elif path == JAR_PATH:
+            self.send_jar()
+        else:
+            self.send_error(404)
+
+    def do_HEAD(self):
+        server = self.server
+        if not self.path.endswith(JAR_PATH):
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(server.jar)))
+        if server.accept_ranges:
+            self.send_header("Accept-Ranges", "bytes")
+        self.end_headers()
+
+    def send_jar(self):
+        server = self.server
+        jar = server.jar
+        range_header = self.headers.get("Range")
+        with server.lock:
+            server.range_headers.append(range_header)
+        time.sleep(server.jar_delay)
+
+        start, end = 0, len(jar) - 1
+        if range_header and server.accept_ranges:
+            first, last = range_header.split("=")[1].split("-")
+            start = int(first)
+            end = min(int(last), end) if last else end
+            if start >= len(jar):
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(jar)}")
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(jar)}")
+        else:
+            self.send_response(200)
+
+        body = jar[start:end + 1]
+        self.send_header("Content-Type", "application/java-archive")
+        self.send_header("Content-Length", str(len(body)))
+        if server.accept_ranges:
+            self.send_header("Accept-Ranges", "bytes")
+        self.end_headers()
+
+        with server.lock:
+            drop = server.drops > 0
+            server.drops -= drop
+        if drop:
+            self.wfile.write(body[:server.drop_after])
+            self.close_connection = True
+            return
+
+        self.wfile.write(body)
+
+
+class StandInPaperMC(ThreadingHTTPServer):
+    """
+    Stand-in PaperMC API on a free local port.
+
+    Attributes can be changed while it runs:
+        delay: Seconds every request waits before it is answered
+        jar_delay: Additional seconds a jar download waits
+        accept_ranges: Whether byte ranges are advertised and served
+        drops: Number of upcoming jar transfers cut short after drop_after bytes
+        hits: Requests per path below /projects/folia
+        range_headers: Range header of every jar request (None without one)
+    """
+
+    def __init__(self, jar: bytes, delay: float = 0.0, jar_delay: float = 0.0, drop_after: int = 1024 * 1024):
+        super().__init__(("127.0.0.1", 0), StandInHandler)
+        self.jar = jar
+        self.sha256 = hashlib.sha256(jar).hexdigest()
+        self.build = {
+            "build": BUILD,
+            "channel": "default",
+            "downloads": {"application": {"name": JAR_NAME, "sha256": self.sha256}},
+        }
+        self.delay = delay
+        self.jar_delay = jar_delay
+        self.drop_after = drop_after
+        self.accept_ranges = True
+        self.drops = 0
+        self.hits = Counter()
+        self.range_headers = []
+        self.lock = threading.Lock()
+        self.url = f"http://127.0.0.1:{self.server_port}/v2"
+
+    def start(self) -> "StandInPaperMC":
+        """Serve requests on a daemon thread"""
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def reset(self, drops: int = 0, accept_ranges: bool = True) -> None:
+        """Set up the jar transfers of the next test and forget the recorded range headers"""
+        with self.lock:
+            self.drops = drops
+            self.accept_ranges = accept_ranges
+            self.range_headers = []
+
+    def total_hits(self) -> int:
+        """Get the number of requests answered so far"""
+        with self.lock:
+            return sum(self.hits.values())
+
+
+def load_get_folia(*api_urls: str):
+    """
+    Load get-folia-enhanced.py as a module that uses api_urls as its mirrors, in order.
+
+    Retries do not back off, so failing tests stay fast.
+    """
+    previous = os.environ.get("PAPERMC_MIRRORS")
+    os.environ["PAPERMC_MIRRORS"] = ",".join(api_urls)
+    try:
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "get-folia-enhanced.py")
+        spec = importlib.util.spec_from_file_location("get_folia_enhanced", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        if previous is None:
+            del os.environ["PAPERMC_MIRRORS"]
+        else:
+            os.environ["PAPERMC_MIRRORS"] = previous
+    module.BACKOFF_BASE = 0
+    return module
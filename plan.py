@@ -0,0 +1,264 @@
+import json
+import os
+import sys
+import tempfile
+import threading
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from result import Err, Ok, Result, is_err, is_ok
+
+from catalog import get_catalog
+from config import BuildConfig, VersionConfig
+from deadline import get_deadline
+from papermc_client import get_client
+from utils import (
+    discover_versions,
+    get_build_info_cached,
+    get_build_channels,
+    get_latest_stable_or_experimental_build,
+    get_remote_versions,
+)
+
+
+def main():
+    get_deadline()
+    versions = sys.argv[1:] or discover_versions()
+    result = create_plan(versions)
+
+    if is_err(result):
+        print(f"Planning failed: {result.unwrap_err()}")
+        exit(1)
+
+    plan = result.unwrap()
+    save_plan(plan)
+
+    print(f"Build plan written to {BuildConfig.get_plan_path()}")
+    for tag, target in plan["targets"].items():
+        print(
+            f" - {tag}: {target['version']} build {target['build']} ({target['channel']}) "
+            f"-> {', '.join(target['tags'])}"
+        )
+
+
+def _latest_across_versions(channels: List[str]) -> Optional[Tuple[str, str, str]]:
+    """Find the newest build of the first channel (in order of preference) that has one."""
+    versions = list(reversed(get_remote_versions()))
+    for channel in channels:
+        for version in versions:
+            for build_num, build_channel in reversed(get_build_channels(version)):
+                if build_channel == channel:
+                    return version, build_num, channel
+    return None
+
+
+def _get_sha256(version: str, build: str) -> Optional[str]:
+    """Get the application jar sha256 of a build from the catalog or its build document."""
+    recorded = get_catalog().get_build(version, build)
+    if recorded and recorded.get("sha256"):
+        return recorded["sha256"]
+
+    build_info = get_build_info_cached(version, build)
+    return build_info.get("downloads", {}).get("application", {}).get("sha256")
+
+
+def resolve_target(tag: str) -> Result[Dict, str]:
+    """
+    Resolve a build target to a pinned version and build.
+
+    - "experimental": newest experimental build across all versions
+    - "latest": newest stable build across all versions (experimental if none)
+    - a version: its latest stable build, falling back to experimental, in
+      which case the image is tagged "<version>-exp<build>" as well as "<version>"
+
+    Args:
+        tag: Target name, usually a directory under versions/
+
+    Returns:
+        Result[Dict, str]: Ok with the pinned target or Err with error message
+    """
+    try:
+        stable = VersionConfig.get_stable_channel_name()
+        experimental = VersionConfig.get_experimental_channel_name()
+
+        if tag == VersionConfig.get_latest_experimental_tag():
+            found = _latest_across_versions([experimental])
+            if not found:
+                return Err("No experimental builds available")
+            version, build, channel = found
+            tags = [tag]
+        elif tag == "latest":
+            found = _latest_across_versions([stable, experimental])
+            if not found:
+                return Err("No builds available")
+            version, build, channel = found
+            tags = [tag]
+        else:
+            version = tag
+            build, is_experimental = get_latest_stable_or_experimental_build(version)
+            if not build:
+                return Err(f"No builds available for version {version}")
+
+            if is_experimental:
+                channel = experimental
+                # Version tag falls back to experimental when no stable exists
+                tags = [VersionConfig.get_version_tag_pattern(version, int(build), True), version]
+            else:
+                channel = stable
+                tags = [version]
+
+        context = f"./versions/{tag}"
+        if not os.path.isdir(context):
+            context = f"./versions/{version}"
+
+        return Ok({
+            "version": version,
+            "build": build,
+            "channel": channel,
+            "download_url": get_client().get_download_url(version, build),
+            "sha256": _get_sha256(version, build),
+            "context": context,
+            "tags": tags,
+        })
+
+    except Exception as e:
+        return Err(f"Error resolving target {tag}: {e}")
+
+
+def create_plan(tags: List[str]) -> Result[Dict, str]:
+    """
+    Resolve every target once into a build plan.
+
+    Args:
+        tags: Targets to plan
+
+    Returns:
+        Result[Dict, str]: Ok with the plan or Err listing the targets that could not be resolved
+    """
+    targets = {}
+    errors = []
+    deadline = get_deadline()
+
+    for index, tag in enumerate(tags):
+        if deadline.expired():
+            errors.append(f"deadline exceeded before resolving {', '.join(tags[index:])}")
+            break
+
+        result = resolve_target(tag)
+        if is_ok(result):
+            targets[tag] = result.unwrap()
+        else:
+            errors.append(result.unwrap_err())
+
+    if errors:
+        if targets:
+            errors.append(f"resolved: {', '.join(targets)}")
+        return Err("; ".join(errors))
+
+    return Ok({
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "targets": targets,
+    })
+
+
+def save_plan(plan: Dict, path: Optional[str] = None) -> None:
+    """Atomically write the plan lockfile."""
+    path = path or BuildConfig.get_plan_path()
+    directory = os.path.dirname(os.path.abspath(path))
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(plan, f, indent=2)
+            f.write("\n")
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def load_plan(path: Optional[str] = None) -> Optional[Dict]:
+    """Load the plan lockfile, or None if there is none."""
+    path = path or BuildConfig.get_plan_path()
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def get_plan_age(plan: Dict) -> Optional[float]:
+    """Get how many seconds ago a plan was created, or None if it has no valid created_at."""
+    try:
+        created_at = datetime.fromisoformat(plan["created_at"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    return (datetime.now(timezone.utc) - created_at).total_seconds()
+
+
+_plan: Optional[Dict] = None
+_plan_loaded = False
+_plan_lock = threading.Lock()
+
+
+def get_plan() -> Optional[Dict]:
+    """
+    Get the plan lockfile that targets are pinned from, loaded once per process.
+
+    The lockfile in use is logged with its creation time. A lockfile older
+    than FOLIA_BUILD_PLAN_MAX_AGE (or without a creation time) is ignored
+    with a warning, unless it was chosen explicitly with FOLIA_BUILD_PLAN.
+
+    Returns:
+        Optional[Dict]: The plan, or None if there is none or it is ignored
+    """
+    global _plan, _plan_loaded
+    with _plan_lock:
+        if _plan_loaded:
+            return _plan
+        _plan_loaded = True
+
+        plan = load_plan()
+        if plan is None:
+            return None
+
+        path = BuildConfig.get_plan_path()
+        created_at = plan.get("created_at", "unknown")
+        age = get_plan_age(plan)
+        max_age = BuildConfig.get_plan_max_age()
+        if max_age is not None and (age is None or age > max_age) and not BuildConfig.is_plan_pinned():
+            print(
+                f"Warning: ignoring build plan {path} created at {created_at}, older than "
+                f"FOLIA_BUILD_PLAN_MAX_AGE ({max_age:.0f}s); run plan.py or set FOLIA_BUILD_PLAN to use it"
+            )
+            return None
+
+        print(f"Using build plan {path} created at {created_at}")
+        _plan = plan
+        return _plan
+
+
+def get_target(tag: str) -> Result[Dict, str]:
+    """
+    Get the pinned target for a tag.
+
+    Targets come from the plan lockfile when it contains the tag, so build
+    and push agree on the same build. Without a lockfile, or with a stale
+    one (see get_plan), the target is resolved on the spot.
+
+    Args:
+        tag: Target name
+
+    Returns:
+        Result[Dict, str]: Ok with the pinned target or Err with error message
+    """
+    plan = get_plan()
+    if plan and tag in plan.get("targets", {}):
+        return Ok(plan["targets"][tag])
+    return resolve_target(tag)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+import importlib.util
+import os
+import sys
+import threading
+from typing import Dict, List, Optional
+
+from result import Err, Ok, Result, is_err, is_ok
+
+from config import BuildConfig, PaperMCConfig
+from deadline import get_deadline
+from papermc_client import fetch_concurrently
+from plan import get_target
+from utils import discover_versions
+
+_get_folia = None
+_get_folia_lock = threading.Lock()
+
+
+def main():
+    get_deadline()
+    tags = sys.argv[1:] or discover_versions()
+    result = prefetch(tags)
+
+    if is_ok(result):
+        print(f"Prefetch succeeded: {result.unwrap()}")
+    else:
+        print(f"Prefetch failed: {result.unwrap_err()}")
+        exit(1)
+
+
+def get_folia_module():
+    """Load get-folia-enhanced.py, whose download code (resume, sha256 checks) is reused."""
+    global _get_folia
+    with _get_folia_lock:
+        if _get_folia is None:
+            path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "get-folia-enhanced.py")
+            spec = importlib.util.spec_from_file_location("get_folia_enhanced", path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            # Downloads share this process's deadline
+            module.DEADLINE = get_deadline().expires_at
+            _get_folia = module
+    return _get_folia
+
+
+def get_jar_path(sha256: str) -> str:
+    """Get the path of a jar in the content-addressed prefetch cache."""
+    return os.path.join(BuildConfig.get_jar_cache_dir(), "sha256", f"{sha256}.jar")
+
+
+def get_prefetched_jar(target: Dict) -> Optional[str]:
+    """
+    Get the prefetched jar of a build target.
+
+    Args:
+        target: Pinned target from the build plan
+
+    Returns:
+        Optional[str]: Path of the jar, or None if it has not been prefetched
+    """
+    sha256 = target.get("sha256")
+    if not sha256:
+        return None
+
+    path = get_jar_path(sha256)
+    return path if os.path.isfile(path) else None
+
+
+def download_jar(target: Dict) -> Result[str, str]:
+    """
+    Download the jar of a target into the prefetch cache.
+
+    The jar is written straight to its content-addressed path and is only
+    renamed there once its sha256 matches, so a present file is always valid.
+
+    Args:
+        target: Pinned target from the build plan
+
+    Returns:
+        Result[str, str]: Ok with the jar path or Err with error message
+    """
+    path = get_jar_path(target["sha256"])
+    result = get_folia_module().download_folia(
+        target["version"], str(target["build"]), path, target["sha256"]
+    )
+    if is_err(result):
+        return Err(f"folia-{target['version']}-{target['build']}.jar: {result.unwrap_err()}")
+    return Ok(path)
+
+
+def prefetch(tags: List[str]) -> Result[str, str]:
+    """
+    Download the jars of all targets concurrently before any image is built.
+
+    Targets are pinned through the build plan, and targets sharing a jar
+    (e.g. "latest" and its version) download it once. Builds then copy the
+    jar from the "jars" build context instead of downloading it inside
+    docker build.
+
+    Args:
+        tags: Targets to prefetch
+
+    Returns:
+        Result[str, str]: Ok with a summary or Err listing the jars that failed
+    """
+    jars = {}
+    errors = []
+
+    for tag in tags:
+        target_result = get_target(tag)
+        if is_err(target_result):
+            errors.append(target_result.unwrap_err())
+            continue
+
+        target = target_result.unwrap()
+        if not target.get("sha256"):
+            errors.append(f"{tag}: no sha256 known, the jar is downloaded during the build")
+            continue
+        jars.setdefault(target["sha256"], target)
+
+    print(f"Prefetching {len(jars)} jars into {BuildConfig.get_jar_cache_dir()}")
+    results = fetch_concurrently(
+        download_jar, list(jars.values()), max_workers=PaperMCConfig.get_max_concurrency()
+    )
+
+    ready = 0
+    for result in results:
+        if is_ok(result):
+            ready += 1
+        else:
+            errors.append(result.unwrap_err())
+
+    if errors:
+        return Err(f"Prefetch incomplete: {ready}/{len(jars)} jars ready ({'; '.join(errors)})")
+    return Ok(f"Prefetch complete: {ready}/{len(jars)} jars ready")
+
+
+if __name__ == "__main__":
+    main()
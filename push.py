@@ -1,19 +1,31 @@
+import argparse
 import subprocess
-import sys
-from typing import List
+from typing import Dict, List, Optional
 
 from result import Err, Ok, Result, is_err, is_ok
 
-from config import DockerConfig
-from utils import discover_versions, get_latest_stable_or_experimental_build
+from config import BuildConfig, DockerConfig
+from deadline import get_deadline
+from fingerprint import get_fingerprint, get_image_fingerprint
+from plan import get_target
+from tag_policy import get_tag_policy, tag_alias
+from utils import discover_versions
 
 
 def main():
-    if len(sys.argv) > 1:
-        versions = sys.argv[1:]
-        result = push_all(versions)
+    get_deadline()
+    parser = argparse.ArgumentParser(description="Push the Folia Docker images")
+    parser.add_argument("versions", nargs="*", help="Targets to push (default: all discovered versions)")
+    parser.add_argument(
+        "--force", action="store_true", default=BuildConfig.force_build(),
+        help="Push images even if the registry already has their input fingerprint (env BUILD_FORCE)"
+    )
+    args = parser.parse_args()
+
+    if args.versions:
+        result = push_all(args.versions, force=args.force)
     else:
-        result = push_all()
+        result = push_all(force=args.force)
 
     if is_ok(result):
         print(f"Push process succeeded: {result.unwrap()}")
@@ -22,77 +34,90 @@ def main():
         exit(1)
 
 
-def push(tag: str) -> Result[str, str]:
+def push(tag: str, target: Optional[Dict] = None, force: bool = False) -> Result[str, str]:
     """
     Push a Docker image with the specified tag to Docker Hub.
 
+    Every tag of the target is pushed, taken from the same build plan that
+    build.py used (see plan.py). Tags whose registry image already carries
+    the target's input fingerprint are skipped, since build.py does not
+    rebuild those locally, unless `force` is set: a forced rebuild (e.g.
+    for a base image update) keeps its fingerprint and must still be
+    published.
+
     Args:
         tag: The tag of the image
+        target: The pinned target, if already resolved (e.g. by the tag policy)
+        force: Push even if the registry image carries the same fingerprint
 
     Returns:
         Result[str, str]: Ok with success message or Err with error message
     """
     try:
-        version_tag = None  # Initialize for all code paths
-
-        # Handle experimental tagging with stable-first logic (mirror build.py logic)
-        if tag == "experimental":
-            # Experimental tag always points to 1.21.11 for now (can be made dynamic later)
-            image_name = DockerConfig.get_image_name("experimental")
-            version_tag = None
-        elif tag == "1.21.11":
-            # Use stable-first logic for version tags (mirror build.py logic)
-            build_result = get_latest_stable_or_experimental_build("1.21.11")
-            if not build_result or not build_result[0]:
-                return Err("No builds available for version 1.21.11")
-
-            build_number = build_result[0]
-            is_experimental = build_result[1]
-
-            if is_experimental:
-                # Use experimental-specific tag as primary
-                image_name = f"{DockerConfig.get_namespace()}/folia:1.21.11-exp{build_number}"
-                # Also push version tag as fallback (points to experimental when no stable exists)
-                version_tag = DockerConfig.get_image_name("1.21.11")
-            else:
-                # Use standard version tag for stable builds
-                image_name = DockerConfig.get_image_name("1.21.11")
-                version_tag = None
-        elif tag == "latest":
-            image_name = DockerConfig.get_image_name("latest")
-            version_tag = None
-        else:
-            image_name = DockerConfig.get_image_name(tag)
-            version_tag = None
+        if target is None:
+            target_result = get_target(tag)
+            if is_err(target_result):
+                return target_result
+            target = target_result.unwrap()
 
-        # Push primary tag
-        cmd = ["docker", "push", image_name]
+        image_names = [DockerConfig.get_image_name(t) for t in target["tags"]]
+        fingerprint = get_fingerprint(target)
+        pushed = []
 
-        print(f"Pushing Docker image: {image_name}")
-        print(f"Command: {' '.join(cmd)}")
+        for image_name in image_names:
+            if not force and get_image_fingerprint(image_name, remote=True) == fingerprint:
+                print(f"Registry image {image_name} is up to date (fingerprint {fingerprint[:12]}), skipping")
+                continue
 
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            cmd = ["docker", "push", image_name]
 
-        # Push version tag if this is experimental (fallback behavior)
-        if version_tag:
-            cmd = ["docker", "push", version_tag]
-            print(f"Also pushing: {version_tag}")
+            print(f"Pushing Docker image: {image_name}")
             print(f"Command: {' '.join(cmd)}")
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            return Ok(f"Docker images '{image_name}' and '{version_tag}' pushed successfully")
 
-        return Ok(f"Docker image '{image_name}' pushed successfully")
+            subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=get_deadline().remaining())
+            pushed.append(image_name)
+
+        if not pushed:
+            return Ok(f"Docker image '{' and '.join(image_names)}' already up to date")
+        return Ok(f"Docker image '{' and '.join(pushed)}' pushed successfully")
 
     except subprocess.CalledProcessError as e:
         error_msg = f"Docker push failed: {e.stderr if e.stderr else e.stdout}"
         return Err(error_msg)
+    except subprocess.TimeoutExpired:
+        return Err("Docker push cancelled: deadline exceeded")
     except Exception as e:
         return Err(f"Unexpected error: {str(e)}")
 
 
-def push_all(versions: List[str] = discover_versions()) -> Result[str, str]:
+def push_alias(alias: str, source: str, target: Dict, force: bool = False) -> Result[str, str]:
+    """
+    Point an alias tag at a pushed image by copying its manifest in the registry.
+
+    Args:
+        alias: Alias tag
+        source: Tag of the pushed image
+        target: The pinned target of the pushed image
+        force: Copy the manifest even if the alias already carries the same fingerprint
+
+    Returns:
+        Result[str, str]: Ok with success message or Err with error message
+    """
+    alias_image = DockerConfig.get_image_name(alias)
+    fingerprint = get_fingerprint(target)
+    if not force and get_image_fingerprint(alias_image, remote=True) == fingerprint:
+        return Ok(f"Registry image {alias_image} is up to date (fingerprint {fingerprint[:12]})")
+    return tag_alias(alias, source, remote=True)
+
+
+def push_all(versions: List[str] = discover_versions(), force: bool = False) -> Result[str, str]:
     """
     Push Docker images based on successful builds from manifest.
+
+    Each unique image is pushed once; its aliases (see tag_policy.py) are
+    then created in the registry by copying the manifest, which uploads
+    nothing. With `force`, images and aliases are pushed even if the
+    registry already has their fingerprint.
     """
     if not versions:
         return Err("No build configurations found!")
@@ -101,23 +126,59 @@ def push_all(versions: List[str] = discover_versions()) -> Result[str, str]:
     for version in versions:
         print(f"- {version}")
 
+    builds, aliases, errors = get_tag_policy(versions)
+    for tag, error in errors.items():
+        print(f"❌ {tag}: {error}")
+
     print("\nStarting pushes...\n")
 
-    success_count = 0
-    for version in versions:
-        print(f"--- Pushing folia:{version} ---")
-        result = push(version)
+    pushed = set()
+    failed = []
+    not_started = []
+    for index, tag in enumerate(builds):
+        if get_deadline().expired():
+            not_started = list(builds)[index:]
+            print(f"⏱️ Deadline exceeded, not pushing: {', '.join(not_started)}\n")
+            break
+
+        print(f"--- Pushing folia:{tag} ---")
+        result = push(tag, builds[tag], force)
 
         if is_ok(result):
             print(f"✅ {result.unwrap()}")
-            success_count += 1
+            pushed.add(tag)
         else:
             print(f"❌ {result.unwrap_err()}")
+            failed.append(tag)
         print()
 
-    if success_count < len(versions):
-        return Err(f"Push incomplete: only {success_count}/{len(versions)} succeeded")
-    return Ok(f"Push complete: {success_count}/{len(versions)} succeeded")
+    alias_count = 0
+    for alias, source in aliases.items():
+        if source not in pushed:
+            print(f"❌ {alias}: {source} was not pushed")
+            failed.append(alias)
+            continue
+
+        result = push_alias(alias, source, builds[source], force)
+        if is_ok(result):
+            print(f"🔗 {result.unwrap()}")
+            alias_count += 1
+        else:
+            print(f"❌ {result.unwrap_err()}")
+            failed.append(alias)
+
+    succeeded = f"{len(pushed)}/{len(builds)} images pushed, {alias_count}/{len(aliases)} aliases tagged"
+    problems = []
+    if errors:
+        problems.append(f"{len(errors)} not resolved ({', '.join(errors)})")
+    if failed:
+        problems.append(f"{len(failed)} failed ({', '.join(failed)})")
+    if not_started:
+        problems.append(f"{len(not_started)} not started before the deadline")
+
+    if problems:
+        return Err(f"Push incomplete: {succeeded}; {'; '.join(problems)}")
+    return Ok(f"Push complete: {succeeded}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,18 @@
+#!/bin/bash
+
+# Fetch the requested build; a jar in the cache volume with the expected
+# sha256 is reused without downloading
+if ! /endkind/venv/bin/python /endkind/get-folia.py --output /endkind/server.jar; then
+    if [ ! -f /endkind/server.jar ]; then
+        echo "Could not fetch Folia $VERSION (build $BUILD), exiting."
+        exit 1
+    fi
+    echo "Could not fetch Folia $VERSION (build $BUILD), starting the jar from the previous run."
+fi
+
+while [ true ]; do
+    java -Xms${MIN_RAM} -Xmx${MAX_RAM} ${JAVA_FLAGS} -jar /endkind/server.jar ${FOLIA_FLAGS}
+
+    echo Server restarting...
+    echo Press CTRL + C to stop.
+done
@@ -10,14 +10,17 @@ from typing import Dict, List, Optional
 sys.path.append(str(Path(__file__).parent.parent))
 
 # Import from parent directory
-import requests
 from result import Err, Ok, Result, is_err
+from catalog import get_catalog
 from config import BuildConfig, VersionConfig
+from deadline import get_deadline
+from papermc_client import get_client
 
 
 def main():
     """Main function to sync experimental versions."""
     print("Starting experimental version sync...")
+    get_deadline()
 
     if not BuildConfig.is_experimental_enabled():
         print("Experimental builds are disabled. Skipping sync.")
@@ -44,14 +47,23 @@ def sync_all_experimental_versions() -> Result[str, str]:
         versions = versions_result.unwrap()
         synced_count = 0
         created_versions = []
+        experimental_builds: Dict[str, int] = {}
+        deadline = get_deadline()
+
+        for index, version in enumerate(versions):
+            if deadline.expired():
+                return Err(
+                    f"Deadline exceeded before checking {', '.join(versions[index:])}; "
+                    f"synced so far: {', '.join(created_versions) or 'none'}"
+                )
 
-        for version in versions:
             # Check if this version has experimental builds
             exp_build_result = get_latest_experimental_build(version)
             if is_err(exp_build_result):
                 continue  # No experimental builds for this version
 
             exp_build = exp_build_result.unwrap()
+            experimental_builds[version] = exp_build
             print(f"Found experimental build for version {version}: build {exp_build}")
 
             # Create or update version directory
@@ -59,11 +71,15 @@ def sync_all_experimental_versions() -> Result[str, str]:
                 synced_count += 1
                 created_versions.append(f"{version}-exp{exp_build}")
 
-        # Create/update experimental directory
+        # Create/update experimental directory from the builds found above
         if created_versions:
-            update_latest_experimental_directory()
+            update_latest_experimental_directory(experimental_builds)
 
-        summary = f"Synced {synced_count} experimental versions: {', '.join(created_versions)}"
+        request_count = get_client().request_count
+        summary = (
+            f"Synced {synced_count} experimental versions: {', '.join(created_versions)} "
+            f"({request_count} PaperMC requests)"
+        )
         return Ok(summary)
 
     except Exception as e:
@@ -71,12 +87,12 @@ def sync_all_experimental_versions() -> Result[str, str]:
 
 
 def get_all_versions() -> Result[List[str], str]:
-    """Get all available versions from PaperMC API."""
+    """Get all available versions from the build catalog."""
     try:
-        response = requests.get("https://api.papermc.io/v2/projects/folia")
-        response.raise_for_status()
-        data = response.json()
-        return Ok(data.get("versions", []))
+        versions = get_catalog().get_versions()
+        if not versions:
+            return Err("Build catalog is empty")
+        return Ok(versions)
     except Exception as e:
         return Err(f"Error fetching versions: {e}")
 
@@ -84,16 +100,11 @@ def get_all_versions() -> Result[List[str], str]:
 def get_latest_experimental_build(version: str) -> Result[int, str]:
     """Get the latest experimental build number for a version."""
     try:
-        response = requests.get(f"https://api.papermc.io/v2/projects/folia/versions/{version}")
-        response.raise_for_status()
-        data = response.json()
-
-        builds = data.get("builds", [])
-        experimental_builds = []
-
-        for build_info in builds:
-            if isinstance(build_info, dict) and build_info.get("channel") == "experimental":
-                experimental_builds.append(build_info["build"])
+        experimental_builds = [
+            int(build_num)
+            for build_num, channel in get_catalog().get_build_channels(version)
+            if channel == "experimental"
+        ]
 
         if not experimental_builds:
             return Err(f"No experimental builds found for version {version}")
@@ -181,7 +192,7 @@ This Docker image provides Folia Minecraft server version {version} {'build ' +
 ## Quick start
 
 ```bash
-docker run -it -d -p 25565:25565 --name folia-{version} -e MINECRAFT_EULA=true ${DOCKER_NAMESPACE:-blackao}/folia:{version}{f'-exp{build}' if is_experimental else ''}
+docker run -it -d -p 25565:25565 --name folia-{version} -e MINECRAFT_EULA=true ${{DOCKER_NAMESPACE:-blackao}}/folia:{version}{f'-exp{build}' if is_experimental else ''}
 ```
 
 ## Environment variables
@@ -196,7 +207,7 @@ docker run -it -d -p 25565:25565 --name folia-{version} -e MINECRAFT_EULA=true $
 ## Build from source
 
 ```bash
-docker build --build-arg VERSION={version} --build-arg BUILD={build} -t ${DOCKER_NAMESPACE:-blackao}/folia:{version}{f'-exp{build}' if is_experimental else ''} .
+docker build --build-arg VERSION={version} --build-arg BUILD={build} -t ${{DOCKER_NAMESPACE:-blackao}}/folia:{version}{f'-exp{build}' if is_experimental else ''} .
 ```
 
 ## Experimental Build Information
@@ -224,14 +235,14 @@ def update_experimental_directory(version_dir: Path, version: str, build: int):
     create_version_readme(version_dir, version, build, is_experimental=True)
 
 
-def update_latest_experimental_directory():
+def update_latest_experimental_directory(experimental_builds: Dict[str, int]):
     """Create or update the experimental directory."""
     try:
         versions_dir = Path(__file__).parent.parent / "versions"
         latest_exp_dir = versions_dir / "experimental"
 
         # Find the most recent experimental version
-        latest_version, latest_build = find_latest_experimental_version()
+        latest_version, latest_build = find_latest_experimental_version(experimental_builds)
 
         if not latest_version:
             print("No experimental versions found to update experimental")
@@ -257,7 +268,7 @@ This Docker image provides the latest experimental build of Folia Minecraft serv
 ## Quick start
 
 ```bash
-docker run -it -d -p 25565:25565 --name folia-latest-exp -e MINECRAFT_EULA=true ${DOCKER_NAMESPACE:-blackao}/folia:experimental
+docker run -it -d -p 25565:25565 --name folia-latest-exp -e MINECRAFT_EULA=true ${{DOCKER_NAMESPACE:-blackao}}/folia:experimental
 ```
 
 ## Experimental Build Warning
@@ -283,31 +294,23 @@ This project is licensed under the terms of the GNU General Public License v3.0
         print(f"Error updating experimental directory: {e}")
 
 
-def find_latest_experimental_version() -> tuple[Optional[str], Optional[int]]:
-    """Find the most recent experimental version."""
-    try:
-        versions_result = get_all_versions()
-        if is_err(versions_result):
-            return None, None
-
-        versions = versions_result.unwrap()
-        latest_version = None
-        latest_build = None
-
-        # Check versions in reverse order (newest first)
-        for version in reversed(versions):
-            build_result = get_latest_experimental_build(version)
-            if not is_err(build_result):
-                latest_version = version
-                latest_build = build_result.unwrap()
-                break
-
-        return latest_version, latest_build
+def find_latest_experimental_version(
+    experimental_builds: Dict[str, int],
+) -> tuple[Optional[str], Optional[int]]:
+    """
+    Find the most recent experimental version.
 
-    except Exception as e:
-        print(f"Error finding latest experimental version: {e}")
+    Args:
+        experimental_builds: Latest experimental build per version, in API order
+            (oldest version first), as collected by sync_all_experimental_versions
+    """
+    if not experimental_builds:
         return None, None
 
+    # Versions are listed oldest first, so the newest one is last
+    latest_version = list(experimental_builds)[-1]
+    return latest_version, experimental_builds[latest_version]
+
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
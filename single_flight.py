@@ -0,0 +1,74 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict, Hashable, TypeVar
+
+R = TypeVar("R")
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key into one execution.
+
+    The first caller for a key runs the function; every caller that arrives
+    while it is still running waits for and shares the same result (or
+    exception). Threaded callers use `do`, asyncio callers `do_async`; both
+    share the same in-flight calls. Results are shared objects, so callers
+    must not mutate them.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def _join(self, key: Hashable) -> tuple:
+        """Return (future, is_leader) for key, registering a new call if needed."""
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                return future, False
+
+            future = Future()
+            # A running future cannot be cancelled, so a cancelled asyncio
+            # waiter (wrap_future cancels its source) leaves the others alone
+            future.set_running_or_notify_cancel()
+            self._calls[key] = future
+            return future, True
+
+    def _run(self, key: Hashable, func: Callable[[], R], future: Future) -> None:
+        try:
+            future.set_result(func())
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    def do(self, key: Hashable, func: Callable[[], R]) -> R:
+        """
+        Run func for key, or wait for the identical call already in flight.
+
+        Raises:
+            Exception: Whatever func raised, for every caller sharing the call
+        """
+        future, is_leader = self._join(key)
+        if is_leader:
+            self._run(key, func, future)
+        return future.result()
+
+    async def do_async(self, key: Hashable, func: Callable[[], R]) -> R:
+        """
+        Asyncio variant of `do`; the blocking func runs in the default executor.
+
+        Raises:
+            Exception: Whatever func raised, for every caller sharing the call
+        """
+        future, is_leader = self._join(key)
+        if is_leader:
+            asyncio.get_running_loop().run_in_executor(None, self._run, key, func, future)
+        return await asyncio.wrap_future(future)
+
+    def in_flight(self) -> int:
+        """Get the number of calls currently in flight."""
+        with self._lock:
+            return len(self._calls)
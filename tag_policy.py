@@ -0,0 +1,105 @@
+import subprocess
+from typing import Dict, List, Tuple
+
+from result import Err, Ok, Result, is_err
+
+from config import DockerConfig
+from deadline import get_deadline
+from plan import get_target
+
+
+def get_image_key(target: Dict) -> Tuple[str, str, str]:
+    """Identify the image a target produces: targets pinned to the same jar get the same image."""
+    return target["version"], str(target["build"]), target.get("sha256") or ""
+
+
+def apply_tag_policy(targets: Dict[str, Dict]) -> Tuple[Dict[str, Dict], Dict[str, str]]:
+    """
+    Decide which targets are built and which tags are aliases.
+
+    Every unique image (version, build and jar) is built once, preferably
+    from its version's own target. Every other tag of the same image,
+    such as "latest", the experimental tag or "<version>-exp<build>", is
+    an alias of the built tag and is applied with `docker tag` or a
+    registry manifest copy instead of another build.
+
+    Args:
+        targets: Pinned targets by tag, in build order
+
+    Returns:
+        Tuple of (targets to build by tag, each tagged with its own tag
+        only; aliases as {alias tag: built tag})
+    """
+    sources = {}
+    for tag, target in targets.items():
+        key = get_image_key(target)
+        current = sources.get(key)
+        if current is None or (tag == target["version"] and current != targets[current]["version"]):
+            sources[key] = tag
+
+    builds, aliases = {}, {}
+    for tag, target in targets.items():
+        source = sources[get_image_key(target)]
+        if tag == source:
+            builds[tag] = dict(target, tags=[tag])
+        for image_tag in target["tags"]:
+            if image_tag != source:
+                aliases[image_tag] = source
+
+    return builds, aliases
+
+
+def get_tag_policy(tags: List[str]) -> Tuple[Dict[str, Dict], Dict[str, str], Dict[str, str]]:
+    """
+    Resolve targets from the build plan and apply the tag policy to them.
+
+    Args:
+        tags: Targets to build or push
+
+    Returns:
+        Tuple of (targets to build, aliases, errors of targets that could
+        not be resolved), see apply_tag_policy
+    """
+    targets, errors = {}, {}
+    for tag in tags:
+        target_result = get_target(tag)
+        if is_err(target_result):
+            errors[tag] = target_result.unwrap_err()
+        else:
+            targets[tag] = target_result.unwrap()
+
+    builds, aliases = apply_tag_policy(targets)
+    return builds, aliases, errors
+
+
+def tag_alias(alias: str, source: str, remote: bool = False) -> Result[str, str]:
+    """
+    Point an alias tag at the image of a built tag.
+
+    Locally this is `docker tag`. In the registry the manifest is copied
+    with `docker buildx imagetools create`, which uploads nothing.
+
+    Args:
+        alias: Alias tag
+        source: Tag of the built image
+        remote: Copy the manifest in the registry instead of tagging locally
+
+    Returns:
+        Result[str, str]: Ok with success message or Err with error message
+    """
+    source_image = DockerConfig.get_image_name(source)
+    alias_image = DockerConfig.get_image_name(alias)
+    if remote:
+        cmd = ["docker", "buildx", "imagetools", "create", "--tag", alias_image, source_image]
+    else:
+        cmd = ["docker", "tag", source_image, alias_image]
+
+    try:
+        subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=get_deadline().remaining())
+    except subprocess.CalledProcessError as e:
+        return Err(f"Tagging {alias_image} failed: {e.stderr if e.stderr else e.stdout}")
+    except subprocess.TimeoutExpired:
+        return Err(f"Tagging {alias_image} cancelled: deadline exceeded")
+
+    return Ok(f"Tagged {alias_image} as an alias of {source_image}")
+
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+
+"""
+Test script for resumable and segmented jar downloads
+
+Runs get-folia-enhanced.py against a local stand-in for the PaperMC API
+whose jar endpoint drops the connection part-way through a transfer.
+"""
+
+import hashlib
+import os
+import sys
+import tempfile
+
+from result import is_err, is_ok
+
+from papermc_stand_in import StandInPaperMC, load_get_folia
+
+JAR = os.urandom(10 * 1024 * 1024 + 123)
+JAR_SHA256 = hashlib.sha256(JAR).hexdigest()
+# Partial downloads are keyed by the digest of the jar they belong to
+PART_SUFFIX = f".{JAR_SHA256[:16]}.part"
+DROP_AFTER = 1024 * 1024
+server = StandInPaperMC(JAR, drop_after=DROP_AFTER)
+
+
+def assert_jar(path):
+    with open(path, "rb") as f:
+        assert hashlib.sha256(f.read()).hexdigest() == JAR_SHA256
+
+
+def test_resume_within_one_call(get_folia, workdir):
+    """Dropped transfers are resumed with Range requests until complete"""
+
+    print("🧪 Testing resume after dropped connections...")
+    server.reset(drops=2)
+    output = os.path.join(workdir, "within", "server.jar")
+
+    result = get_folia.download_folia("1.21.8", "1", output)
+    assert is_ok(result), result
+
+    assert_jar(output)
+    assert not os.path.exists(f"{output}{PART_SUFFIX}")
+    assert server.range_headers == [None, f"bytes={DROP_AFTER}-", f"bytes={2 * DROP_AFTER}-"], \
+        server.range_headers
+    print("✅ Jar completed over three requests and verified")
+
+
+def test_resume_across_calls(get_folia, workdir):
+    """A partial download left by a failed run is picked up by the next one"""
+
+    print("🧪 Testing resume across invocations...")
+    output = os.path.join(workdir, "across", "server.jar")
+
+    server.reset(drops=1)
+    get_folia.MAX_RETRIES = 0
+    try:
+        result = get_folia.download_folia("1.21.8", "1", output)
+    finally:
+        get_folia.MAX_RETRIES = 4
+    assert is_err(result), result
+    assert os.path.getsize(f"{output}{PART_SUFFIX}") == DROP_AFTER
+    print("✅ Partial download kept after failure")
+
+    server.reset(drops=0)
+    result = get_folia.download_folia("1.21.8", "1", output)
+    assert is_ok(result), result
+    assert server.range_headers == [f"bytes={DROP_AFTER}-"], server.range_headers
+    assert_jar(output)
+    print("✅ Next run resumed and verified the jar")
+
+
+def test_corrupt_partial_is_discarded(get_folia, workdir):
+    """A partial file that does not hash to the expected digest is thrown away"""
+
+    print("🧪 Testing corrupt partial download...")
+    output = os.path.join(workdir, "corrupt", "server.jar")
+    os.makedirs(os.path.dirname(output))
+    with open(f"{output}{PART_SUFFIX}", "wb") as f:
+        f.write(b"\0" * DROP_AFTER)
+
+    server.reset(drops=0)
+    result = get_folia.download_folia("1.21.8", "1", output)
+    assert is_err(result), result
+    assert "Checksum mismatch" in result.unwrap_err()
+    assert not os.path.exists(f"{output}{PART_SUFFIX}")
+    print("✅ Corrupt partial download rejected and removed")
+
+
+def test_other_jar_partial_is_discarded(get_folia, workdir):
+    """A partial file left by a different jar is removed instead of resumed"""
+
+    print("🧪 Testing partial download of another jar...")
+    output = os.path.join(workdir, "other", "server.jar")
+    os.makedirs(os.path.dirname(output))
+    other_part = f"{output}.{'0' * 16}.part"
+    with open(other_part, "wb") as f:
+        f.write(JAR[:DROP_AFTER])
+
+    server.reset(drops=0)
+    result = get_folia.download_folia("1.21.8", "1", output)
+    assert is_ok(result), result
+    assert_jar(output)
+    assert server.range_headers == [None], server.range_headers
+    assert not os.path.exists(other_part)
+    print("✅ Partial download of another jar discarded")
+
+
+def test_segmented_download(get_folia, workdir):
+    """Multiple connections fetch disjoint ranges, and a dropped segment is resumed"""
+
+    print("🧪 Testing segmented download...")
+    server.reset(drops=1)
+    output = os.path.join(workdir, "segments", "server.jar")
+
+    result = get_folia.download_folia("1.21.8", "1", output, connections=4)
+    assert is_ok(result), result
+    assert_jar(output)
+    assert not os.path.exists(f"{output}.{JAR_SHA256[:16]}.segments")
+
+    # A 10 MiB jar is split into two segments (4 MiB minimum), plus one retry for the dropped one
+    assert len(server.range_headers) == 3, server.range_headers
+    assert all(header and header.count("-") == 1 and not header.endswith("-")
+               for header in server.range_headers), server.range_headers
+    print("✅ Segments downloaded concurrently and verified")
+
+
+def test_segmented_fallback(get_folia, workdir):
+    """Without Accept-Ranges the jar is downloaded as one stream"""
+
+    print("🧪 Testing fallback to a single stream...")
+    server.reset(drops=0, accept_ranges=False)
+    output = os.path.join(workdir, "fallback", "server.jar")
+
+    result = get_folia.download_folia("1.21.8", "1", output, connections=4)
+    assert is_ok(result), result
+    assert_jar(output)
+    assert server.range_headers == [None], server.range_headers
+    print("✅ Single stream used when ranges are not advertised")
+
+
+def main():
+    server.start()
+    get_folia = load_get_folia(server.url)
+
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            test_resume_within_one_call(get_folia, workdir)
+            test_resume_across_calls(get_folia, workdir)
+            test_corrupt_partial_is_discarded(get_folia, workdir)
+            test_other_jar_partial_is_discarded(get_folia, workdir)
+            test_segmented_download(get_folia, workdir)
+            test_segmented_fallback(get_folia, workdir)
+    except AssertionError as e:
+        print(f"❌ Test failed: {e}")
+        sys.exit(1)
+    finally:
+        server.shutdown()
+
+    print("\n✅ All download tests passed")
+
+
+if __name__ == "__main__":
+    main()
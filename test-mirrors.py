@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+
+"""
+Test script for mirror selection, hedged requests and failover
+
+Runs the PaperMC client and get-folia-enhanced.py against two local
+stand-ins for the PaperMC API that answer at different speeds.
+"""
+
+import hashlib
+import os
+import socket
+import sys
+import tempfile
+import time
+
+os.environ["PAPERMC_HTTP_CACHE"] = "false"
+os.environ["PAPERMC_RATE_LIMIT"] = "0"
+os.environ["PAPERMC_MAX_RETRIES"] = "0"
+os.environ["PAPERMC_HEDGE_DELAY"] = "0.2"
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from result import is_ok
+
+from papermc_client import PaperMCClient
+from papermc_stand_in import StandInPaperMC, load_get_folia
+
+JAR = os.urandom(256 * 1024)
+JAR_SHA256 = hashlib.sha256(JAR).hexdigest()
+
+
+def unreachable_url():
+    """Get a URL on a port nothing listens on"""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    return f"http://127.0.0.1:{port}/v2"
+
+
+def test_fastest_mirror_preferred(slow, fast):
+    """Probing ranks the faster mirror first even when it is configured second"""
+
+    print("🧪 Testing latency-based mirror selection...")
+    slow_server, slow_url = slow
+    fast_server, fast_url = fast
+
+    client = PaperMCClient(mirrors=[slow_url, fast_url])
+    assert client.get_versions() == ["1.21.8"]
+    assert client.mirrors.ranked() == [fast_url, slow_url], client.mirrors.ranked()
+
+    fast_hits, slow_hits = fast_server.total_hits(), slow_server.total_hits()
+    client.get_builds("1.21.8")
+    assert fast_server.total_hits() == fast_hits + 1 and slow_server.total_hits() == slow_hits
+    assert client.hedge_count == 0
+    print("✅ Requests go to the fastest mirror")
+
+
+def test_slow_request_is_hedged(slow, fast):
+    """A request slower than the hedge delay is raced against the next mirror"""
+
+    print("🧪 Testing hedged requests...")
+    slow_server, slow_url = slow
+    fast_server, fast_url = fast
+
+    client = PaperMCClient(mirrors=[slow_url, fast_url])
+    client.get_versions()
+
+    # The preferred mirror suddenly stalls; the other one is still reasonably fast
+    fast_server.delay = 1.5
+    try:
+        started_at = time.monotonic()
+        assert client.get_build("1.21.8", "1")["build"] == 1
+        elapsed = time.monotonic() - started_at
+    finally:
+        fast_server.delay = 0
+
+    assert client.hedge_count == 1, client.hedge_count
+    assert elapsed < 1.0, elapsed
+    print(f"✅ Hedged request answered in {elapsed:.2f}s instead of 1.5s")
+
+
+def test_unreachable_mirror_skipped(fast):
+    """A mirror that cannot be reached is ranked last and not used"""
+
+    print("🧪 Testing failover from an unreachable mirror...")
+    _, fast_url = fast
+    dead_url = unreachable_url()
+
+    client = PaperMCClient(mirrors=[dead_url, fast_url])
+    assert client.get_versions() == ["1.21.8"]
+    assert client.mirrors.ranked() == [fast_url, dead_url], client.mirrors.ranked()
+    assert not client.mirrors.is_healthy(dead_url)
+    print("✅ Unreachable mirror skipped")
+
+
+def test_get_folia_mirrors(slow, fast):
+    """get-folia probes its mirrors and fails over when the preferred one is down"""
+
+    print("🧪 Testing get-folia mirror selection and failover...")
+    _, slow_url = slow
+    fast_server, fast_url = fast
+
+    get_folia = load_get_folia(slow_url, fast_url)
+    get_folia.rank_mirrors()
+    assert get_folia.BASE_URL == f"{fast_url}/projects/folia", get_folia.BASE_URL
+
+    get_folia = load_get_folia(unreachable_url(), fast_url)
+    with tempfile.TemporaryDirectory() as workdir:
+        output = os.path.join(workdir, "server.jar")
+        jar_hits = fast_server.total_hits()
+        result = get_folia.download_folia("1.21.8", "1", output)
+        assert is_ok(result), result
+        with open(output, "rb") as f:
+            assert hashlib.sha256(f.read()).hexdigest() == JAR_SHA256
+        assert fast_server.total_hits() == jar_hits + 2
+    print("✅ get-folia picked the fastest mirror and failed over to a healthy one")
+
+
+def main():
+    slow_server = StandInPaperMC(JAR, delay=0.3).start()
+    fast_server = StandInPaperMC(JAR).start()
+    slow = slow_server, slow_server.url
+    fast = fast_server, fast_server.url
+
+    try:
+        test_fastest_mirror_preferred(slow, fast)
+        test_slow_request_is_hedged(slow, fast)
+        test_unreachable_mirror_skipped(fast)
+        test_get_folia_mirrors(slow, fast)
+    except AssertionError as e:
+        print(f"❌ Test failed: {e}")
+        sys.exit(1)
+    finally:
+        slow[0].shutdown()
+        fast[0].shutdown()
+
+    print("\n✅ All mirror tests passed")
+
+
+if __name__ == "__main__":
+    main()
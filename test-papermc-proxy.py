@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+
+"""
+Test script for the PaperMC pull-through proxy
+
+Starts a local stand-in for the PaperMC API, puts papermc_proxy.py in front
+of it and points get-folia-enhanced.py and the PaperMC client at the proxy.
+"""
+
+import hashlib
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from result import is_ok
+
+from papermc_stand_in import StandInPaperMC, load_get_folia
+
+JAR = os.urandom(512 * 1024)
+JAR_SHA256 = hashlib.sha256(JAR).hexdigest()
+# Slow enough for concurrent proxy misses to overlap
+upstream = StandInPaperMC(JAR, jar_delay=0.3)
+
+
+def start(server):
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}/v2"
+
+
+def test_concurrent_jar_misses(get_folia, workdir):
+    """Many hosts fetching the same jar cause one upstream download"""
+
+    print("🧪 Testing concurrent jar downloads through the proxy...")
+
+    def fetch(index):
+        return get_folia.download_folia("1.21.8", "1", os.path.join(workdir, f"host{index}", "server.jar"))
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        results = list(executor.map(fetch, range(6)))
+
+    assert all(is_ok(result) for result in results), results
+    for index in range(6):
+        with open(os.path.join(workdir, f"host{index}", "server.jar"), "rb") as f:
+            assert hashlib.sha256(f.read()).hexdigest() == JAR_SHA256
+    assert upstream.hits["/versions/1.21.8/builds/1/downloads/folia-1.21.8-1.jar"] == 1, upstream.hits
+    assert upstream.hits["/versions/1.21.8/builds/1"] == 1, upstream.hits
+    print("✅ Six downloads, one upstream jar request")
+
+
+def test_range_requests(proxy_url):
+    """Jars are served with range support so clients can resume and segment"""
+
+    print("🧪 Testing range requests...")
+    url = f"{proxy_url}/projects/folia/versions/1.21.8/builds/1/downloads/folia-1.21.8-1.jar"
+
+    head = requests.head(url)
+    assert head.headers["Accept-Ranges"] == "bytes"
+    assert int(head.headers["Content-Length"]) == len(JAR)
+
+    partial = requests.get(url, headers={"Range": "bytes=100-199"})
+    assert partial.status_code == 206
+    assert partial.content == JAR[100:200]
+
+    assert requests.get(url, headers={"Range": f"bytes={len(JAR)}-"}).status_code == 416
+    print("✅ Partial content served from the jar cache")
+
+
+def test_metadata(proxy_url):
+    """Metadata is served from memory and upstream errors pass through"""
+
+    print("🧪 Testing metadata caching...")
+    from papermc_client import PaperMCClient
+
+    client = PaperMCClient(api_url=proxy_url)
+    for _ in range(3):
+        assert client.get_versions() == ["1.21.8"]
+        assert client.get_builds("1.21.8")[0]["build"] == 1
+    assert upstream.hits[""] == 1, upstream.hits
+    assert upstream.hits["/versions/1.21.8/builds"] == 1, upstream.hits
+
+    assert requests.get(f"{proxy_url}/projects/folia/versions/9.9.9").status_code == 404
+    assert requests.get(f"{proxy_url}/projects/paper").status_code == 404
+    print("✅ Metadata cached and unknown documents answered with 404")
+
+
+def test_unexpected_error(proxy, proxy_url):
+    """Errors other than upstream ones are answered with 502, not a dropped connection"""
+
+    print("🧪 Testing unexpected errors...")
+    original = proxy.proxy.get_metadata
+
+    def fail(path):
+        raise RuntimeError("boom")
+
+    proxy.proxy.get_metadata = fail
+    try:
+        assert requests.get(f"{proxy_url}/projects/folia").status_code == 502
+    finally:
+        proxy.proxy.get_metadata = original
+    assert requests.get(f"{proxy_url}/projects/folia").status_code == 200
+    print("✅ Unexpected error answered with 502")
+
+
+def main():
+    upstream_url = upstream.start().url
+
+    with tempfile.TemporaryDirectory() as workdir:
+        os.environ.update({
+            "PAPERMC_API_URL": upstream_url,
+            "PAPERMC_CACHE_DIR": os.path.join(workdir, "cache"),
+            "FOLIA_JAR_CACHE": os.path.join(workdir, "jars"),
+            "PAPERMC_HTTP_CACHE": "false",
+            "PAPERMC_RATE_LIMIT": "0",
+            # The proxy is a service and must not inherit a command's budget
+            "FOLIA_DEADLINE": "0.5",
+        })
+
+        from papermc_proxy import create_server
+
+        proxy = create_server("127.0.0.1", 0)
+        proxy.RequestHandlerClass.log_message = lambda *args: None
+        proxy.RequestHandlerClass.log_error = lambda *args: None
+        proxy_url = start(proxy)
+        get_folia = load_get_folia(proxy_url)
+
+        try:
+            test_concurrent_jar_misses(get_folia, os.path.join(workdir, "hosts"))
+            test_range_requests(proxy_url)
+            test_metadata(proxy_url)
+            time.sleep(0.5)
+            test_unexpected_error(proxy, proxy_url)
+        except AssertionError as e:
+            print(f"❌ Test failed: {e}")
+            sys.exit(1)
+        finally:
+            proxy.shutdown()
+            upstream.shutdown()
+
+    print("\n✅ All proxy tests passed")
+
+
+if __name__ == "__main__":
+    main()
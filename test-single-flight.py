@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+
+"""
+Test script for coalescing concurrent calls with SingleFlight
+
+Checks that threaded and asyncio callers of the same key share one
+execution, and that cancelling one asyncio waiter does not break the
+call for the others.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from single_flight import SingleFlight
+
+
+def slow_call(calls, result="done", delay=0.3):
+    """Get a function that records its calls and returns result after delay seconds"""
+    def func():
+        calls.append(1)
+        time.sleep(delay)
+        return result
+    return func
+
+
+def test_threads_share_call():
+    """Threads calling the same key at once run the function once"""
+
+    print("🧪 Testing threaded callers...")
+    flight, calls, results = SingleFlight(), [], []
+    func = slow_call(calls)
+
+    threads = [threading.Thread(target=lambda: results.append(flight.do("key", func))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1, calls
+    assert results == ["done"] * 4, results
+    assert flight.in_flight() == 0
+    print("✅ Four threads shared one call")
+
+
+def test_cancelled_waiter_leaves_others():
+    """Cancelling an asyncio waiter does not cancel the call a thread is waiting on"""
+
+    print("🧪 Testing cancellation of an asyncio waiter...")
+    flight, calls, thread_results = SingleFlight(), [], []
+    func = slow_call(calls)
+
+    async def run():
+        leader = asyncio.create_task(flight.do_async("key", func))
+        await asyncio.sleep(0.05)
+
+        def thread_caller():
+            try:
+                thread_results.append(flight.do("key", func))
+            except BaseException as e:
+                thread_results.append(e)
+
+        thread = threading.Thread(target=thread_caller)
+        thread.start()
+
+        try:
+            await asyncio.wait_for(flight.do_async("key", func), timeout=0.05)
+            raise AssertionError("the waiter was not cancelled")
+        except asyncio.TimeoutError:
+            pass
+
+        result = await leader
+        await asyncio.get_running_loop().run_in_executor(None, thread.join)
+        return result
+
+    assert asyncio.run(run()) == "done"
+    assert thread_results == ["done"], thread_results
+    assert len(calls) == 1, calls
+    assert flight.in_flight() == 0
+    print("✅ The thread and the leader still got the shared result")
+
+
+def main():
+    try:
+        test_threads_share_call()
+        test_cancelled_waiter_leaves_others()
+    except AssertionError as e:
+        print(f"❌ Test failed: {e}")
+        sys.exit(1)
+
+    print("\n✅ All single flight tests passed")
+
+
+if __name__ == "__main__":
+    main()
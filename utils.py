@@ -1,9 +1,11 @@
 import os
 import re
-import requests
 from typing import List, Tuple, Optional
 
-from config import BuildConfig
+from catalog import get_catalog
+from config import BuildConfig, PaperMCConfig
+from memo_cache import MemoCache
+from papermc_client import get_client
 
 
 def _parse_version_key(tag: str) -> Tuple:
@@ -159,8 +161,31 @@ def get_experimental_tags(version: str) -> List[str]:
 # Build Detection Functions for Stable-First Tagging Strategy
 # =============================================================================
 
-# Simple cache to avoid repeated API calls during build process
-_build_info_cache = {}
+# Bounded memoization of build metadata lookups. Failures expire after a short
+# TTL so long-lived callers retry them instead of keeping stale errors.
+_build_info_cache = MemoCache(
+    max_size=PaperMCConfig.get_memo_max_size(),
+    ttl=PaperMCConfig.get_memo_ttl(),
+    negative_ttl=PaperMCConfig.get_memo_negative_ttl(),
+)
+_build_channels_cache = MemoCache(
+    max_size=PaperMCConfig.get_memo_max_size(),
+    ttl=PaperMCConfig.get_memo_ttl(),
+    negative_ttl=PaperMCConfig.get_memo_negative_ttl(),
+)
+
+
+def get_cache_stats() -> dict:
+    """
+    Get hit/miss statistics of the build metadata memoization.
+
+    Returns:
+        Dictionary with 'build_info' and 'build_channels' counters
+    """
+    return {
+        "build_info": _build_info_cache.stats(),
+        "build_channels": _build_channels_cache.stats(),
+    }
 
 
 def get_build_info_cached(version: str, build: str) -> dict:
@@ -174,10 +199,11 @@ def get_build_info_cached(version: str, build: str) -> dict:
     Returns:
         Dictionary containing build information, or empty dict on error
     """
-    cache_key = f"{version}-{build}"
-    if cache_key not in _build_info_cache:
-        _build_info_cache[cache_key] = get_build_info(version, build)
-    return _build_info_cache[cache_key]
+    return _build_info_cache.get_or_load(
+        (version, str(build)),
+        lambda: get_build_info(version, build),
+        is_failure=lambda build_info: not build_info,
+    )
 
 def get_build_info(version: str, build: str) -> dict:
     """
@@ -191,10 +217,7 @@ def get_build_info(version: str, build: str) -> dict:
         Dictionary containing build information, or empty dict on error
     """
     try:
-        url = f"https://api.papermc.io/v2/projects/folia/versions/{version}/builds/{build}"
-        response = requests.get(url)
-        response.raise_for_status()
-        return response.json()
+        return get_client().get_build(version, build)
     except Exception as e:
         print(f"Error fetching build info for {version}-{build}: {e}")
         return {}
@@ -211,10 +234,82 @@ def is_build_experimental(version: str, build: str) -> bool:
     Returns:
         True if build is experimental, False otherwise
     """
-    build_info = get_build_info(version, build)
+    recorded = get_catalog().get_build(version, build)
+    if recorded:
+        return recorded.get("channel") == "experimental"
+
+    build_info = get_build_info_cached(version, build)
     return build_info.get("channel") == "experimental"
 
 
+def get_remote_versions() -> List[str]:
+    """
+    Get every Folia version published on PaperMC, oldest first.
+
+    Returns:
+        List of versions from the build catalog, or from the API if the catalog is empty
+
+    Raises:
+        requests.RequestException: If the catalog is empty and the API cannot be reached
+    """
+    versions = get_catalog().get_versions()
+    if versions:
+        return versions
+    return get_client().get_versions()
+
+
+def get_build_channels(version: str) -> List[Tuple[str, Optional[str]]]:
+    """
+    Get the channel of every build of a version, oldest first.
+
+    Channels are answered from the local build catalog, which is refreshed
+    whenever it is stale and therefore not memoized here. Versions missing
+    from the catalog are resolved from a single bulk builds listing, and only
+    when that listing is unavailable does this fall back to one request per
+    build; those answers are memoized.
+
+    Args:
+        version: Folia version
+
+    Returns:
+        List of (build_number, channel) tuples
+
+    Raises:
+        requests.RequestException: If the builds of the version cannot be listed
+        RuntimeError: If the channel of a build cannot be resolved
+    """
+    catalog = get_catalog()
+    if catalog.has_version(version):
+        return catalog.get_build_channels(version)
+    return _build_channels_cache.get_or_load(version, lambda: _load_build_channels(version))
+
+
+def _load_build_channels(version: str) -> List[Tuple[str, Optional[str]]]:
+    client = get_client()
+
+    try:
+        builds = client.get_builds(version)
+    except Exception as e:
+        print(f"Bulk builds listing unavailable for {version}, falling back to per-build lookups: {e}")
+    else:
+        build_channels = []
+        for build_info in builds:
+            build_num = str(build_info["build"])
+            _build_info_cache.put((version, build_num), build_info)
+            build_channels.append((build_num, build_info.get("channel")))
+        return build_channels
+
+    data = client.get_version(version)
+    build_channels = []
+    for build_num in data.get("builds", []):
+        build_info = get_build_info_cached(version, str(build_num))
+        if not build_info:
+            # Guessing a channel here would silently pick the wrong tag
+            raise RuntimeError(f"Could not resolve the channel of {version} build {build_num}")
+        build_channels.append((str(build_num), build_info.get("channel")))
+    return build_channels
+
+
 def get_latest_stable_or_experimental_build(version: str) -> Tuple[Optional[str], bool]:
     """
     Get the latest build number for a version, preferring stable over experimental.
@@ -228,12 +323,7 @@ def get_latest_stable_or_experimental_build(version: str) -> Tuple[Optional[str]
         is_experimental: True if the build is experimental, False if stable
     """
     try:
-        url = f"https://api.papermc.io/v2/projects/folia/versions/{version}"
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
-
-        builds = data.get("builds", [])
+        builds = get_build_channels(version)
         if not builds:
             return None, False
 
@@ -241,19 +331,11 @@ def get_latest_stable_or_experimental_build(version: str) -> Tuple[Optional[str]
         latest_stable = None
         latest_experimental = None
 
-        for build_num in reversed(builds):
-            build_info = get_build_info_cached(version, str(build_num))
-
-            # Skip if build_info is empty or not a dict
-            if not build_info or not isinstance(build_info, dict):
-                continue
-
-            channel = build_info.get("channel")
-
+        for build_num, channel in reversed(builds):
             if channel == "default" and latest_stable is None:
-                latest_stable = str(build_num)
+                latest_stable = build_num
             elif channel == "experimental" and latest_experimental is None:
-                latest_experimental = str(build_num)
+                latest_experimental = build_num
 
             # Early exit if we have both
             if latest_stable and latest_experimental:
@@ -265,8 +347,8 @@ def get_latest_stable_or_experimental_build(version: str) -> Tuple[Optional[str]
         if latest_experimental:
             return latest_experimental, True
 
-        # Fallback: use the latest build number if no channel info found
-        return str(builds[-1]), True
+        print(f"No stable or experimental builds found for {version}")
+        return None, False
 
     except Exception as e:
         print(f"Error getting build info for {version}: {e}")
@@ -285,16 +367,9 @@ def get_latest_build_for_channel(version: str, channel: str = "default") -> Opti
         Latest build number for the channel, or None if not found
     """
     try:
-        url = f"https://api.papermc.io/v2/projects/folia/versions/{version}"
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
-
-        builds = data.get("builds", [])
-        for build_num in reversed(builds):
-            build_info = get_build_info_cached(version, str(build_num))
-            if build_info.get("channel") == channel:
-                return str(build_num)
+        for build_num, build_channel in reversed(get_build_channels(version)):
+            if build_channel == channel:
+                return build_num
 
         return None
 
@@ -314,23 +389,14 @@ def get_available_builds(version: str) -> dict:
         Dictionary with 'stable' and 'experimental' build lists
     """
     try:
-        url = f"https://api.papermc.io/v2/projects/folia/versions/{version}"
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
-
-        builds = data.get("builds", [])
         stable_builds = []
         experimental_builds = []
 
-        for build_num in builds:
-            build_info = get_build_info_cached(version, str(build_num))
-            channel = build_info.get("channel", "experimental")  # Default to experimental for safety
-
+        for build_num, channel in get_build_channels(version):
             if channel == "default":
-                stable_builds.append(str(build_num))
+                stable_builds.append(build_num)
             else:
-                experimental_builds.append(str(build_num))
+                experimental_builds.append(build_num)
 
         return {
             "stable": stable_builds,